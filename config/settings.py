@@ -27,6 +27,7 @@ BROWSER_TYPE = "chromium"          # 浏览器类型: chromium, firefox, webkit
 BROWSER_HEADLESS = True            # 无头模式
 BROWSER_TIMEOUT = 30000            # 页面加载超时(毫秒)
 BROWSER_NAVIGATION_TIMEOUT = 60000 # 导航超时(毫秒)
+BLOCK_HEAVY_RESOURCES = True       # 拦截图片/字体/音视频请求（解析只需要HTML）
 
 # ============ 整理设置 ============
 MAX_PAGES = 5                      # 每个源最多整理页数（保守设置）
@@ -16,9 +16,6 @@ from typing import Dict, List
 
 from utils.helpers import setup_logging
 from utils.keyword_list import load_keywords
-from scraper.ccgp_bxsearcher import BxSearchParams, CCGPBxSearcher
-from scraper.ccgp_parser import CCGPAnnouncementParser
-from scraper.fetcher import PlaywrightFetcher
 from extractor import DataCleaner
 from storage import Database
 from config.settings import KEYWORD_SWITCH_DELAY_MIN, KEYWORD_SWITCH_DELAY_MAX
@@ -239,6 +236,12 @@ def _iter_business_cards(formatted: Dict) -> List[Dict]:
 
 def run_bxsearch(args):
     """bxsearch 搜索 + 详情解析 + 名片聚合"""
+    # 延迟导入：只有搜索命令才需要Playwright；
+    # cards等子命令不必付浏览器栈的导入开销
+    from scraper.ccgp_bxsearcher import BxSearchParams, CCGPBxSearcher
+    from scraper.ccgp_parser import CCGPAnnouncementParser
+    from scraper.fetcher import PlaywrightFetcher
+
     keywords = load_keywords(args.kw, args.kw_file)
     if not keywords:
         print("参数错误: 需要提供 --kw 或 --kw-file")
@@ -327,7 +330,9 @@ def run_bxsearch(args):
                     skipped += 1
                     continue
 
-                detail_html = fetcher.get_page(url, wait_for="networkidle")
+                # 详情页是静态HTML，domcontentloaded即可；networkidle会
+                # 等统计脚本等外部请求静默，白白拖慢每条详情页的抓取
+                detail_html = fetcher.get_page(url, wait_for="domcontentloaded")
                 if not detail_html:
                     logger.warning(f"详情页获取失败，跳过: {url}")
                     continue
@@ -347,32 +352,35 @@ def run_bxsearch(args):
                 # 清洗
                 announcement = cleaner.clean_announcement(announcement)
 
-                announcement_id = db.insert_announcement(announcement)
-                if not announcement_id:
-                    announcement_id = db.get_announcement_id_by_url(url)
-                if not announcement_id:
-                    continue
-
-                new_announcements += 1
-
-                # 名片聚合写入
-                for card in _iter_business_cards(formatted):
-                    cleaned = cleaner.clean_contacts({
-                        "phones": card.get("phones") or [],
-                        "emails": card.get("emails") or [],
-                        "company": card.get("company") or "",
-                        "contacts": [card.get("contact_name") or ""],
-                    })
-                    company = cleaned.get("company") or ""
-                    names = cleaned.get("contacts") or []
-                    contact_name = names[0] if names else ""
-                    phones = cleaned.get("phones") or []
-                    emails = cleaned.get("emails") or []
-
-                    card_id = db.upsert_business_card(company, contact_name, phones=phones, emails=emails)
-                    if card_id:
-                        db.add_business_card_mention(card_id, announcement_id, role=card.get("role") or "")
-                        card_writes += 1
+                # 单条公告的入库和名片写入合并为一个事务，
+                # 避免每张名片一次fsync
+                with db.bulk():
+                    announcement_id = db.insert_announcement(announcement)
+                    if not announcement_id:
+                        announcement_id = db.get_announcement_id_by_url(url)
+                    if not announcement_id:
+                        continue
+
+                    new_announcements += 1
+
+                    # 名片聚合写入
+                    for card in _iter_business_cards(formatted):
+                        cleaned = cleaner.clean_contacts({
+                            "phones": card.get("phones") or [],
+                            "emails": card.get("emails") or [],
+                            "company": card.get("company") or "",
+                            "contacts": [card.get("contact_name") or ""],
+                        })
+                        company = cleaned.get("company") or ""
+                        names = cleaned.get("contacts") or []
+                        contact_name = names[0] if names else ""
+                        phones = cleaned.get("phones") or []
+                        emails = cleaned.get("emails") or []
+
+                        card_id = db.upsert_business_card(company, contact_name, phones=phones, emails=emails)
+                        if card_id:
+                            db.add_business_card_mention(card_id, announcement_id, role=card.get("role") or "")
+                            card_writes += 1
 
             # 关键词切换延迟（不是最后一个关键词时）
             if kw != keywords[-1]:
@@ -407,8 +415,9 @@ def show_business_cards(args):
         print(f"数量: {len(cards)}")
 
         for i, c in enumerate(cards, 1):
-            phones = ", ".join(c.get("phones") or [])
-            emails = ", ".join(c.get("emails") or [])
+            # phones/emails已由SQL拼成逗号分隔串
+            phones = c.get("phones") or ""
+            emails = c.get("emails") or ""
             print(f"\n[{i}] {c.get('contact_name', '')}")
             if phones:
                 print(f"  电话: {phones}")
@@ -421,7 +430,6 @@ def show_business_cards(args):
 
 def main():
     """主函数"""
-    import sys
     # print(f"[WORKER DEBUG] sys.argv: {sys.argv}")
     
     # 解析命令行参数
@@ -17,6 +17,11 @@ hidden_imports = [
     'websockets',
     'openpyxl.cell',
     'openpyxl.styles',
+    # lxml lets openpyxl use its C-backed XML writer; without these the
+    # frozen build silently falls back to xml.etree
+    'lxml',
+    'lxml._elementpath',
+    'lxml.etree',
     'license_utils',
     'scraper',
     'storage',
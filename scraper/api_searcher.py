@@ -7,6 +7,7 @@ import time
 from typing import Dict, List
 import requests
 from urllib.parse import urlencode
+from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
@@ -156,7 +157,6 @@ class AlternativeListScraper:
             if not html:
                 continue
 
-            from bs4 import BeautifulSoup
             soup = BeautifulSoup(html, 'lxml')
 
             # 查找所有公告链接
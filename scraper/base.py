@@ -4,6 +4,7 @@
 """
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import List, Dict, Generator
 
@@ -117,7 +118,6 @@ class BaseScraper:
                 logger.error(f"获取详情页异常 (尝试 {attempt + 1}/{MAX_RETRIES}): {e}")
 
             # 重试前等待
-            import time
             time.sleep(RETRY_DELAY)
 
         return {}
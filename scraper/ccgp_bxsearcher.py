@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Union
 from urllib.parse import urlencode, urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from config.settings import (
@@ -27,6 +27,10 @@ from config.settings import (
 
 logger = logging.getLogger(__name__)
 
+# 列表页只需要结果ul子树；parse_only让bs4跳过页面其余部分的
+# 节点构建（导航、页脚等占列表页HTML的大头）
+_RESULT_LIST_STRAINER = SoupStrainer('ul', class_='vT-srch-result-list-bid')
+
 
 PIN_MU_MAP = {
     "all": 0,
@@ -217,16 +221,26 @@ class CCGPBxSearcher:
 
         return results
 
+    # 封禁检测放在页面侧完成，只回传一个布尔值：整页innerText在结果页
+    # 可达数百KB，逐次拉回Python再做子串匹配纯属浪费；封禁提示页很短，
+    # 截取前2000字符足够覆盖
+    _BLOCKED_JS = (
+        "() => {"
+        " const t = document.body && document.body.innerText"
+        "   ? document.body.innerText.slice(0, 2000) : '';"
+        " return t.includes('访问过于频繁') || t.includes('稍后再试');"
+        "}"
+    )
+
     def _is_blocked(self) -> bool:
         try:
-            text = self.page.evaluate("() => document.body && document.body.innerText ? document.body.innerText : ''")
+            return bool(self.page.evaluate(self._BLOCKED_JS))
         except Exception:
             return False
-        return ("访问过于频繁" in text) or ("稍后再试" in text)
 
     def _scrape_current_page(self) -> List[Dict]:
         html = self.page.content()
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_RESULT_LIST_STRAINER)
         items: List[Dict] = []
 
         for li in soup.select(self.RESULT_ITEM_SELECTOR):
@@ -11,6 +11,20 @@ from .table_parser import SmartTableParser
 
 logger = logging.getLogger(__name__)
 
+# 高频小正则统一在模块级预编译：re的内部缓存虽避免了重复编译，
+# 但每次调用仍要做一次缓存查找；解析一条公告会命中这些模式几十次
+_MOBILE_RE = re.compile(r'1[3-9]\d{9}')
+_LANDLINE_RE = re.compile(r'0\d{2,3}-?\d{7,8}')
+_DASH_PHONE_RE = re.compile(r'\d{3,4}-\d{7,8}')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PUNCT_RE = re.compile(r'[、，,：:]')
+_LIST_SPLIT_RE = re.compile(r'[、，,]')
+_NAME_SPLIT_RE = re.compile(r'[、，,;\s\\]')
+_LONG_DIGITS_RE = re.compile(r'\d{7,13}')
+_NON_NAME_RE = re.compile(r'[^一-龥a-zA-Z]')
+_PHONE_SUFFIX_RE = re.compile(r'[\\/、，,;\s]+(\d{4,8})\b')
+_AMOUNT_NUM_RE = re.compile(r'[\d,]+\.?\d*')
+
 
 class CCGPAnnouncementParser:
     """公共资源交易网公告解析器"""
@@ -30,6 +44,9 @@ class CCGPAnnouncementParser:
             'buyer': r'(采购人信息|采购单位)',
             'agent': r'(采购代理机构|代理机构)',
         }
+        # 表格解析器复用同一实例：SmartTableParser初始化时会构建
+        # 字段映射自动机，逐条公告重建纯属浪费
+        self.table_parser = SmartTableParser()
 
     def parse(self, html: str, url: str) -> Dict:
         """
@@ -49,7 +66,9 @@ class CCGPAnnouncementParser:
 
         result = {
             'url': url,
-            '_html': html,  # 供 format_for_storage 提取全文使用（避免 BeautifulSoup 无法 JSON 序列化）
+            # 全文在这里就地提取：format_for_storage不再对整个HTML
+            # 做第二次BeautifulSoup解析
+            '_full_text': self._extract_content_text(soup),
             'meta': self._parse_meta(soup),
             'summary_table': self._parse_summary_table(soup),
         }
@@ -144,9 +163,8 @@ class CCGPAnnouncementParser:
         if not table:
             return {}
 
-        # 使用智能表格解析器
-        table_parser = SmartTableParser()
-        parsed = table_parser.parse_table(table)
+        # 使用智能表格解析器（实例在__init__里创建，整批公告共用）
+        parsed = self.table_parser.parse_table(table)
 
         # 返回结构化数据
         return parsed['structured']
@@ -288,7 +306,7 @@ class CCGPAnnouncementParser:
                 contacts['agent']['address'] = value
             elif '代理机构联系方式' in key or '代理机构联系人' in key:
                 # 支持多人格式: "黄丹彤16620120513、崔世杰15800204406"
-                raw_parts = [p.strip() for p in re.split(r'[、，,]', value) if p.strip()]
+                raw_parts = [p.strip() for p in _LIST_SPLIT_RE.split(value) if p.strip()]
                 agent_contacts = []
                 first_phone = ''
                 first_name = ''
@@ -380,7 +398,7 @@ class CCGPAnnouncementParser:
                         contacts['buyer']['phone'] = phone
                         # 去掉电话后剩下的可能是联系人姓名
                         name_part = raw_value.replace(phone, '').strip()
-                        name_part = re.sub(r'[、，,：:]', '', name_part).strip()
+                        name_part = _PUNCT_RE.sub('', name_part).strip()
                         if name_part:
                             contacts['buyer']['contact_name'] = name_part
                     else:
@@ -424,15 +442,15 @@ class CCGPAnnouncementParser:
                         pass 
                     
                     # 使用正则移除类似电话的数字串
-                    text_no_phone = re.sub(r'0\d{2,3}-?\d{7,8}', '', raw_value)
-                    text_no_phone = re.sub(r'\d{7,13}', '', text_no_phone) # 移除长数字
+                    text_no_phone = _LANDLINE_RE.sub('', raw_value)
+                    text_no_phone = _LONG_DIGITS_RE.sub('', text_no_phone) # 移除长数字
                     
                     # 分割姓名
-                    raw_names = [n.strip() for n in re.split(r'[、，,;\s\\]', text_no_phone) if n.strip()]
+                    raw_names = [n.strip() for n in _NAME_SPLIT_RE.split(text_no_phone) if n.strip()]
                     # 过滤掉非名字（如纯符号）
                     clean_names = []
                     for n in raw_names:
-                        n = re.sub(r'[^\u4e00-\u9fa5a-zA-Z]', '', n) # 仅保留汉字和字母
+                        n = _NON_NAME_RE.sub('', n) # 仅保留汉字和字母
                         if len(n) >= 2: # 名字通常至少2个字
                             clean_names.append(n)
                             
@@ -485,23 +503,16 @@ class CCGPAnnouncementParser:
             (联系人姓名, 电话号码, 邮箱)
         """
         # 查找电话号码
-        phone_patterns = [
-            r'1[3-9]\d{9}',
-            r'0\d{2,3}-?\d{7,8}',
-            r'\d{3,4}-\d{7,8}',
-        ]
-
         phone = ''
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
+        for pattern in (_MOBILE_RE, _LANDLINE_RE, _DASH_PHONE_RE):
+            match = pattern.search(text)
             if match:
                 phone = match.group(0)
                 break
 
         # 查找邮箱
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
         email = ''
-        match_email = re.search(email_pattern, text)
+        match_email = _EMAIL_RE.search(text)
         if match_email:
             email = match_email.group(0)
 
@@ -514,7 +525,7 @@ class CCGPAnnouncementParser:
             
         name = name.strip()
         # 去除标点和特殊字符
-        name = re.sub(r'[、，,：:]', '', name).strip()
+        name = _PUNCT_RE.sub('', name).strip()
 
         return name, phone, email
 
@@ -526,7 +537,7 @@ class CCGPAnnouncementParser:
             {'amount': 数值, 'unit': 单位, 'original': 原始文本}
         """
         # 提取数字
-        numbers = re.findall(r'[\d,]+\.?\d*', text)
+        numbers = _AMOUNT_NUM_RE.findall(text)
 
         if numbers:
             amount = numbers[0].replace(',', '')
@@ -559,17 +570,11 @@ class CCGPAnnouncementParser:
             
         phones = []
         
-        # 1. 提取标准全号码
-        # 0xxx-xxxxxxx, 1xxxxxxxxxx
-        standard_patterns = [
-            r'(0\d{2,3}-?\d{7,8})', # 座机 group 1
-            r'(1[3-9]\d{9})'        # 手机 group 2
-        ]
-        
+        # 1. 提取标准全号码（座机 + 手机）
         # 查找所有全号码的位置和值
         matches = [] # list of (start, end, phone_str, type)
-        for p in standard_patterns:
-            for m in re.finditer(p, text):
+        for p in (_LANDLINE_RE, _MOBILE_RE):
+            for m in p.finditer(text):
                 matches.append((m.start(), m.end(), m.group(), 'std'))
         
         # 排序
@@ -597,7 +602,7 @@ class CCGPAnnouncementParser:
             # 在 substring 中查找可能是后缀的数字
             # 模式：分隔符(、, \ / space) + 数字(4-8位)
             # 注意：\ 是特殊字符，需要转义
-            suffix_iter = re.finditer(r'[\\/、，,;\s]+(\d{4,8})\b', substring)
+            suffix_iter = _PHONE_SUFFIX_RE.finditer(substring)
             
             for sm in suffix_iter:
                 suffix = sm.group(1)
@@ -648,6 +653,11 @@ class CCGPAnnouncementParser:
         # 中标信息 - 优先从详细内容获取（表格通常没有）
         bid_info = content.get('bid_info', {})
 
+        # 各角色联系人只取一次，下面不再重复走嵌套get链
+        buyer_c = contacts.get('buyer') or {}
+        agent_c = contacts.get('agent') or {}
+        project_c = contacts.get('project') or {}
+
         # 基本信息
         formatted = {
             'title': parsed_data['meta'].get('title', ''),
@@ -667,36 +677,36 @@ class CCGPAnnouncementParser:
             'bid_amount': self._format_amount(bid_info.get('amount') or summary.get('amount', {})),
 
             # 采购人信息
-            'buyer_name': buyer_info.get('name') or contacts.get('buyer', {}).get('name', ''),
-            'buyer_address': buyer_info.get('address') or contacts.get('buyer', {}).get('address', ''),
-            'buyer_contact': buyer_info.get('contact') or contacts.get('buyer', {}).get('contact_name', ''),
+            'buyer_name': buyer_info.get('name') or buyer_c.get('name', ''),
+            'buyer_address': buyer_info.get('address') or buyer_c.get('address', ''),
+            'buyer_contact': buyer_info.get('contact') or buyer_c.get('contact_name', ''),
             # For buyer_phone: try direct phone first, then extract from contact field
             'buyer_phone': self._format_phones(
-                contacts.get('buyer', {}).get('phone', '') or
+                buyer_c.get('phone', '') or
                 self._extract_phones(buyer_info.get('contact', ''))
             ),
-            'buyer_email': contacts.get('buyer', {}).get('email', ''),
+            'buyer_email': buyer_c.get('email', ''),
 
             # 代理机构信息
-            'agent_name': agent_info.get('name') or contacts.get('agent', {}).get('name', ''),
-            'agent_address': agent_info.get('address') or contacts.get('agent', {}).get('address', ''),
-            'agent_contact': agent_info.get('contact') or contacts.get('agent', {}).get('contact_name', ''),
+            'agent_name': agent_info.get('name') or agent_c.get('name', ''),
+            'agent_address': agent_info.get('address') or agent_c.get('address', ''),
+            'agent_contact': agent_info.get('contact') or agent_c.get('contact_name', ''),
             # For agent_phone: try direct phone first, then extract from contact field
             'agent_phone': self._format_phones(
-                contacts.get('agent', {}).get('phone', '') or
+                agent_c.get('phone', '') or
                 self._extract_phones(agent_info.get('contact', ''))
             ),
-            'agent_email': contacts.get('agent', {}).get('email', ''),
+            'agent_email': agent_c.get('email', ''),
             # 代理机构联系人列表（支持多人）
-            'agent_contacts_list': contacts.get('agent', {}).get('contacts_list', []),
+            'agent_contacts_list': agent_c.get('contacts_list', []),
 
             # 项目联系人
             'project_contacts': (
-                contacts_info.get('details') or 
-                contacts.get('project', {}).get('details') or 
-                self._parse_contact_names(contacts_info.get('name') or contacts.get('project', {}).get('names', []))
+                contacts_info.get('details') or
+                project_c.get('details') or
+                self._parse_contact_names(contacts_info.get('name') or project_c.get('names', []))
             ),
-            'project_phone': contacts_info.get('phone') or contacts.get('project', {}).get('phone', ''),
+            'project_phone': contacts_info.get('phone') or project_c.get('phone', ''),
 
             # 专家
             'experts': project_info.get('experts') or summary.get('experts', '') or ', '.join(content.get('experts', [])),
@@ -723,14 +733,8 @@ class CCGPAnnouncementParser:
         
         phones = []
         # 查找电话号码
-        phone_patterns = [
-            r'1[3-9]\d{9}',
-            r'0\d{2,3}-?\d{7,8}',
-        ]
-        
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            for m in matches:
+        for pattern in (_MOBILE_RE, _LANDLINE_RE):
+            for m in pattern.findall(text):
                 if m not in phones:
                     phones.append(m)
         return phones
@@ -758,15 +762,22 @@ class CCGPAnnouncementParser:
             return [n.strip() for n in names.split('、') if n.strip()]
         return []
 
-    def _extract_full_text(self, parsed_data: Dict) -> str:
-        """提取完整文本内容"""
-        html = parsed_data.get('_html') or ""
-        if not html:
-            return ""
-
-        soup = BeautifulSoup(html, "lxml")
+    @staticmethod
+    def _extract_content_text(soup: BeautifulSoup) -> str:
+        """从已解析的soup中提取完整文本内容"""
         content_div = soup.find("div", class_="vF_detail_content")
         if content_div:
             return content_div.get_text(separator='\n', strip=True)
-
         return ""
+
+    def _extract_full_text(self, parsed_data: Dict) -> str:
+        """提取完整文本内容（parse阶段已就地提取）"""
+        text = parsed_data.get('_full_text')
+        if text is not None:
+            return text
+
+        # 兼容旧版parse结果（带_html原文）
+        html = parsed_data.get('_html') or ""
+        if not html:
+            return ""
+        return self._extract_content_text(BeautifulSoup(html, "lxml"))
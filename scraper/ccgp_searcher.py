@@ -8,12 +8,16 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from config.settings import BROWSER_TIMEOUT, BROWSER_NAVIGATION_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+# 列表页只需要结果ul子树；parse_only让bs4跳过页面其余部分的
+# 节点构建（导航、页脚等占列表页HTML的大头）
+_RESULT_LIST_STRAINER = SoupStrainer('ul', class_='vT-srch-result-list-bid')
+
 
 class CCGPSearcher:
     """中国公共资源交易网搜索爬虫"""
@@ -111,12 +115,18 @@ class CCGPSearcher:
 
         time.sleep(3)  # 等待页面完全加载和反爬检测
 
-        # 3. 检查是否被封禁
+        # 3. 检查是否被封禁（页面侧判断，只回传布尔值，不拉整页innerText）
         try:
-            page_text = self.page.evaluate("() => document.body && document.body.innerText ? document.body.innerText : ''")
+            blocked = self.page.evaluate(
+                "() => {"
+                " const t = document.body && document.body.innerText"
+                "   ? document.body.innerText.slice(0, 2000) : '';"
+                " return t.includes('访问过于频繁') || t.includes('稍后再试');"
+                "}"
+            )
         except Exception:
-            page_text = ""
-        if "访问过于频繁" in page_text or "稍后再试" in page_text:
+            blocked = False
+        if blocked:
             logger.error("⚠️ 检测到反爬限制，请稍后再试")
             return []
 
@@ -268,8 +278,10 @@ class CCGPSearcher:
             return results
 
         html = self.page.content()
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_RESULT_LIST_STRAINER)
 
+        # URL去重在收集时用set做，免去整理完再过一遍的后处理
+        seen_urls = set()
         for li in soup.select(self.SELECTORS['result_items']):
             a = li.find("a", href=True)
             if not a:
@@ -280,9 +292,13 @@ class CCGPSearcher:
             if not title or not href:
                 continue
 
-            if href and not href.startswith("http"):
+            if not href.startswith("http"):
                 href = urljoin("https://www.ccgp.gov.cn/", href)
 
+            if href in seen_urls:
+                continue
+            seen_urls.add(href)
+
             info_text = ""
             span = li.find("span")
             if span:
@@ -310,14 +326,7 @@ class CCGPSearcher:
                 'source': '中国公共资源交易网搜索',
             })
 
-        # 去重（按URL）
-        dedup: Dict[str, Dict] = {}
-        for r in results:
-            u = r.get("url") or ""
-            if u and u not in dedup:
-                dedup[u] = r
-
-        return list(dedup.values())
+        return results
 
     def _go_to_next_page(self) -> bool:
         """翻到下一页"""
@@ -8,11 +8,16 @@ import logging
 import random
 import time
 from typing import Dict, List
+from urllib.parse import urljoin
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 logger = logging.getLogger(__name__)
 
+# 列表页只需要结果ul子树；parse_only让bs4跳过页面其余部分的
+# 节点构建（导航、页脚等占列表页HTML的大头）
+_RESULT_LIST_STRAINER = SoupStrainer('ul', class_='vT-srch-result-list-bid')
+
 
 class CCGPSearcherEnhanced:
     """公共资源交易网智能搜索爬虫 - 增强版（纯同步实现）"""
@@ -68,22 +73,21 @@ class CCGPSearcherEnhanced:
         except:
             pass
 
-    def _is_blocked(self, page_text: str) -> bool:
+    # 封禁检测在页面侧完成，只回传布尔值：整页innerText在结果页可达
+    # 数百KB，拉回Python再做子串匹配纯属浪费；封禁提示页很短，截取
+    # 前2000字符足够覆盖
+    _BLOCKED_JS = (
+        "() => {"
+        " const t = (document.body && document.body.innerText"
+        "   ? document.body.innerText.slice(0, 2000) : '').toLowerCase();"
+        " return ['访问过于频繁', '稍后再试', '验证码', 'captcha', '人机验证']"
+        "   .some(s => t.includes(s));"
+        "}"
+    )
+
+    def _is_blocked(self) -> bool:
         """检查是否被封禁"""
-        blocked_indicators = [
-            '访问过于频繁',
-            '稍后再试',
-            '验证码',
-            'captcha',
-            '人机验证',
-        ]
-
-        page_text_lower = page_text.lower()
-        for indicator in blocked_indicators:
-            if indicator in page_text_lower:
-                return True
-
-        return False
+        return bool(self.page.evaluate(self._BLOCKED_JS))
 
     def search(
         self,
@@ -137,8 +141,7 @@ class CCGPSearcherEnhanced:
 
         # 策略3: 检查是否被封禁
         try:
-            page_text = self.page.evaluate("() => document.body.innerText")
-            if self._is_blocked(page_text):
+            if self._is_blocked():
                 logger.error("⚠️ 检测到反爬限制")
                 logger.error("建议：降低访问频率并稍后再试，或改用公开的分类列表页抓取 + 本地过滤。")
                 return []
@@ -270,8 +273,10 @@ class CCGPSearcherEnhanced:
 
         try:
             html = self.page.content()
-            soup = BeautifulSoup(html, "lxml")
+            soup = BeautifulSoup(html, "lxml", parse_only=_RESULT_LIST_STRAINER)
 
+            # URL去重在收集时用set做，免去整理完再过一遍的后处理
+            seen_urls = set()
             for li in soup.select("ul.vT-srch-result-list-bid > li"):
                 a = li.find("a", href=True)
                 if not a:
@@ -284,9 +289,12 @@ class CCGPSearcherEnhanced:
 
                 # 构建完整URL
                 if not href.startswith("http"):
-                    from urllib.parse import urljoin
                     href = urljoin("https://www.ccgp.gov.cn/", href)
 
+                if href in seen_urls:
+                    continue
+                seen_urls.add(href)
+
                 info_text = ""
                 span = li.find("span")
                 if span:
@@ -317,13 +325,7 @@ class CCGPSearcherEnhanced:
         except Exception as e:
             logger.debug(f"整理页面失败: {e}")
 
-        # 去重（按URL）
-        dedup: Dict[str, Dict] = {}
-        for r in results:
-            u = r.get("url") or ""
-            if u and u not in dedup:
-                dedup[u] = r
-        return list(dedup.values())
+        return results
 
     def _go_to_next_page_safe(self) -> bool:
         """安全翻页"""
@@ -3,6 +3,7 @@ Playwright浏览器管理器
 封装浏览器操作，提供简单的API
 增加人类行为模拟以降低被封禁风险
 """
+import glob
 import logging
 import random
 import time
@@ -22,6 +23,7 @@ from config.settings import (
     DETAIL_DELAY_MIN,
     DETAIL_DELAY_MAX,
     SIMULATE_HUMAN_BEHAVIOR,
+    BLOCK_HEAVY_RESOURCES,
 )
 
 logger = logging.getLogger(__name__)
@@ -135,7 +137,6 @@ class PlaywrightFetcher:
                     logger.info(f"[DEBUG] Browsers directory exists: {browsers_path}")
 
                     # Find the browser executable by walking the directory
-                    import glob
                     exe_name = 'chrome.exe' if BROWSER_TYPE == 'chromium' else (
                         'firefox.exe' if BROWSER_TYPE == 'firefox' else 'webkit.exe'
                     )
@@ -204,6 +205,17 @@ class PlaywrightFetcher:
                 );
             """)
 
+            # 拦截图片/字体/音视频：解析只用HTML文本，这些资源占了
+            # 页面流量的大头；保留CSS/JS，避免页面脚本行为异常被识别
+            if BLOCK_HEAVY_RESOURCES:
+                blocked_types = {'image', 'font', 'media'}
+                self.context.route(
+                    '**/*',
+                    lambda route: route.abort()
+                    if route.request.resource_type in blocked_types
+                    else route.continue_()
+                )
+
             # 创建页面
             self.page = self.context.new_page()
             self.page.set_default_timeout(BROWSER_TIMEOUT)
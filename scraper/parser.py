@@ -3,17 +3,159 @@
 解析公告列表页和详情页
 """
 import logging
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from config.settings import REQUIRED_KEYWORDS, EXCLUDE_KEYWORDS, MAX_AGE_DAYS
 
 logger = logging.getLogger(__name__)
 
+# 关键词自动机（Aho-Corasick）
+# 一次线性扫描即可判断标题是否命中任意关键词，
+# 替代逐个关键词的 `kw in title` 循环；库缺失时退回原实现
+try:
+    import ahocorasick
+
+    def _build_automaton(keywords):
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return automaton
+
+    _REQUIRED_AC = _build_automaton(REQUIRED_KEYWORDS)
+    _EXCLUDE_AC = _build_automaton(EXCLUDE_KEYWORDS)
+except ImportError:
+    _REQUIRED_AC = None
+    _EXCLUDE_AC = None
+
+
+def _title_matches_keywords(title: str) -> bool:
+    """标题包含必需关键词且不含排除关键词"""
+    if _REQUIRED_AC is not None:
+        if next(_REQUIRED_AC.iter(title), None) is None:
+            return False
+        return next(_EXCLUDE_AC.iter(title), None) is None
+
+    # 回退：逐个关键词扫描
+    if not any(kw in title for kw in REQUIRED_KEYWORDS):
+        return False
+    return not any(kw in title for kw in EXCLUDE_KEYWORDS)
+
+
+# 预编译的 XPath 选择器
+# 遍历在 libxml2（C 层）完成，避免 bs4 在 Python 层逐元素匹配正则属性；
+# class 按空格分隔的完整token匹配（小写化后比较），href 按后缀匹配
+_LOWER = "translate(normalize-space(@class),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz')"
+
+
+def _class_token_xp(*tokens) -> str:
+    return ' or '.join(
+        f"contains(concat(' ',{_LOWER},' '),' {token} ')" for token in tokens)
+
+
+_LIST_SELECTOR_XPS = [
+    etree.XPath(f"//a[{_class_token_xp('title', 'link', 'item')}]"),
+    etree.XPath("//a[substring(@href, string-length(@href)-4)='.html'"
+                " or substring(@href, string-length(@href)-5)='.shtml'"
+                " or substring(@href, string-length(@href)-3)='.asp']"),
+    etree.XPath("//li"),
+    etree.XPath("//tr"),
+    etree.XPath(f"//div[{_class_token_xp('item', 'list', 'row')}]"),
+]
+
+# 标题按优先级逐个XPath求值，与bs4回退路径的h1>h2>title>class
+# 顺序一致；合成单个union按文档序取第一个的话，<head>里的<title>
+# 会永远压过正文里的<h1>（带站点后缀的页面标题并不是公告标题）
+_TITLE_XPS = (
+    etree.XPath("//h1[string-length(normalize-space(.))>5]"),
+    etree.XPath("//h2[string-length(normalize-space(.))>5]"),
+    etree.XPath("//title[string-length(normalize-space(.))>5]"),
+    etree.XPath("//*[contains(@class,'title') or contains(@class,'heading')]"
+                "[string-length(normalize-space(.))>5]"),
+)
+
+_CONTENT_XP = etree.XPath(
+    "//div[contains(@class,'content') or contains(@class,'article')"
+    " or contains(@class,'detail') or contains(@class,'main')"
+    " or contains(@id,'content') or contains(@id,'article')"
+    " or contains(@id,'detail')]"
+    " | //article | //main")
+
+
+# 日期匹配：优先用re2（DFA、无回溯），缺失时用内置re；
+# 模式只编译一次，避免每个条目重复走re的编译缓存
+try:
+    import re2 as _date_re
+except ImportError:
+    _date_re = re
+
+_DATE_RES = [
+    _date_re.compile(r'\d{4}-\d{2}-\d{2}'),
+    _date_re.compile(r'\d{4}\.\d{2}\.\d{2}'),
+    _date_re.compile(r'\d{4}/\d{2}/\d{2}'),
+    _date_re.compile(r'\d{4}年\d{1,2}月\d{1,2}日'),
+]
+
+
+def _find_date(text: str) -> Optional[str]:
+    """按优先级在文本中查找第一个日期"""
+    for pattern in _DATE_RES:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+
+# 复用同一个HTML解析器实例，避免每个页面重新构造parser；
+# 解析时即丢弃注释/处理指令/纯空白文本节点，缩小后续遍历的树
+_HTML_PARSER = lxml_html.HTMLParser(
+    encoding='utf-8', recover=True,
+    remove_comments=True, remove_pis=True, remove_blank_text=True)
+
+# 正文提取时跳过的"页面骨架"标签
+_SKIP_TAGS = frozenset(('script', 'style', 'nav', 'header', 'footer', 'aside'))
+
+
+def _collect_text(node, parts: list):
+    if not isinstance(node.tag, str) or node.tag in _SKIP_TAGS:
+        return
+    if node.text:
+        parts.append(node.text)
+    for child in node:
+        _collect_text(child, parts)
+        # 元素边界补一个换行，等价于bs4 get_text(separator='\n')：
+        # 否则相邻单元格/段落的文本会粘成一串（数字粘连还会造成
+        # 电话/金额的误匹配）；多余的空行由调用方统一清理
+        parts.append('\n')
+        # tail在子元素之外，即使子树被跳过也要保留
+        if child.tail:
+            parts.append(child.tail)
+
+
+def _text_without_chrome(elem) -> str:
+    """收集元素文本，跳过脚本/样式/导航等子树（只读，不修改树）"""
+    parts = []
+    _collect_text(elem, parts)
+    return ''.join(parts)
+
+
+def _parse_html_tree(html: str):
+    """解析为lxml树，失败返回None（调用方回退到bs4）"""
+    try:
+        tree = lxml_html.fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+    except Exception:
+        return None
+    return tree if tree is not None else None
+
 
 class ListPageParser:
     """公告列表页解析器"""
@@ -21,6 +163,11 @@ class ListPageParser:
     def __init__(self, base_url: str):
         self.base_url = base_url
         self.parsed_url = urlparse(base_url)
+        # 同源URL前缀，常见情况用startswith判断即可，跳过urlparse
+        self._same_origin_prefixes = (
+            f"{self.parsed_url.scheme}://{self.parsed_url.netloc}/",
+            f"//{self.parsed_url.netloc}/",
+        )
 
     def parse_items(self, html: str) -> List[Dict]:
         """
@@ -38,6 +185,66 @@ class ListPageParser:
         if not html:
             return []
 
+        items = []
+        target_items = 10  # 找到足够多的条目就停止
+
+        # 优先走lxml XPath（C层遍历），解析失败时回退到bs4
+        tree = _parse_html_tree(html)
+        if tree is not None:
+            for xpath in _LIST_SELECTOR_XPS:
+                remaining = target_items - len(items)
+                if remaining <= 0:
+                    break
+                # 已收集越多，后续策略扫描的元素越少
+                found = self._try_parse_xpath(
+                    tree, xpath, limit=min(100, remaining * 2))
+                items.extend(found)
+        else:
+            items = self._parse_items_soup(html, target_items)
+
+        # 过滤和清洗数据
+        filtered_items = self._filter_items(items)
+        logger.info(f"从列表页解析出 {len(filtered_items)} 个公告")
+        return filtered_items
+
+    def _try_parse_xpath(self, tree, xpath, limit: int = 100) -> List[Dict]:
+        """尝试用预编译XPath解析"""
+        items = []
+
+        for elem in xpath(tree)[:limit]:
+            # 查找链接
+            link = elem if elem.tag == 'a' else elem.find('.//a')
+            if link is None:
+                continue
+
+            # 获取标题
+            title = link.text_content().strip()
+            if not title or len(title) < 10:
+                continue
+
+            # 获取URL
+            href = link.get('href', '')
+            if not href:
+                continue
+
+            # 转换为绝对URL
+            url = self._make_absolute_url(href)
+            if not url:
+                continue
+
+            # 获取日期
+            date = self._extract_date(elem.text_content())
+
+            items.append({
+                'title': title,
+                'url': url,
+                'date': date
+            })
+
+        return items
+
+    def _parse_items_soup(self, html: str, target_items: int = 10) -> List[Dict]:
+        """bs4回退解析（lxml无法解析时使用）"""
         soup = BeautifulSoup(html, 'lxml')
         items = []
 
@@ -51,21 +258,20 @@ class ListPageParser:
         ]
 
         for tag, attrs in selectors:
-            found = self._try_parse_selector(soup, tag, attrs)
-            if found:
-                items.extend(found)
-                if len(items) > 10:  # 找到足够多的条目就停止
-                    break
+            remaining = target_items - len(items)
+            if remaining <= 0:
+                break
+            found = self._try_parse_selector(
+                soup, tag, attrs, limit=min(100, remaining * 2))
+            items.extend(found)
 
-        # 过滤和清洗数据
-        filtered_items = self._filter_items(items)
-        logger.info(f"从列表页解析出 {len(filtered_items)} 个公告")
-        return filtered_items
+        return items
 
-    def _try_parse_selector(self, soup: BeautifulSoup, tag: str, attrs: Dict) -> List[Dict]:
+    def _try_parse_selector(self, soup: BeautifulSoup, tag: str, attrs: Dict,
+                            limit: int = 100) -> List[Dict]:
         """尝试用特定选择器解析"""
         items = []
-        elements = soup.find_all(tag, attrs=attrs, limit=100)
+        elements = soup.find_all(tag, attrs=attrs, limit=limit)
 
         for elem in elements:
             # 查找链接
@@ -89,7 +295,7 @@ class ListPageParser:
                 continue
 
             # 获取日期
-            date = self._extract_date(elem)
+            date = self._extract_date(elem.get_text())
 
             items.append({
                 'title': title,
@@ -111,6 +317,10 @@ class ListPageParser:
         # 处理相对路径
         absolute = urljoin(self.base_url, url)
 
+        # 同源前缀快速通过（常见情况），免去urlparse
+        if absolute.startswith(self._same_origin_prefixes):
+            return absolute
+
         # 只保留同域名的URL
         parsed = urlparse(absolute)
         if parsed.netloc and parsed.netloc != self.parsed_url.netloc:
@@ -118,23 +328,9 @@ class ListPageParser:
 
         return absolute
 
-    def _extract_date(self, element) -> Optional[str]:
-        """从元素中提取日期"""
-        # 尝试多种日期格式
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',
-            r'\d{4}\.\d{2}\.\d{2}',
-            r'\d{4}/\d{2}/\d{2}',
-            r'\d{4}年\d{1,2}月\d{1,2}日',
-        ]
-
-        text = element.get_text()
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0)
-
-        return None
+    def _extract_date(self, text: str) -> Optional[str]:
+        """从文本中提取日期"""
+        return _find_date(text)
 
     def _filter_items(self, items: List[Dict]) -> List[Dict]:
         """过滤公告条目"""
@@ -146,14 +342,8 @@ class ListPageParser:
         for item in items:
             title = item.get('title', '')
 
-            # 检查必须包含的关键词
-            has_required = any(kw in title for kw in REQUIRED_KEYWORDS)
-            if not has_required:
-                continue
-
-            # 检查排除关键词
-            has_excluded = any(kw in title for kw in EXCLUDE_KEYWORDS)
-            if has_excluded:
+            # 检查必需/排除关键词（单次自动机扫描）
+            if not _title_matches_keywords(title):
                 continue
 
             # 检查日期（如果有的话）
@@ -173,9 +363,45 @@ class ListPageParser:
         return filtered
 
 
+def _parse_worker(html: str, url: str) -> Dict:
+    """子进程解析入口
+
+    lxml树无法跨进程传递，因此按HTML文本分发、各进程自行解析
+    """
+    return DetailPageParser().parse(html, url)
+
+
 class DetailPageParser:
     """公告详情页解析器"""
 
+    def parse_many(self, items: Iterable[Tuple[str, str]],
+                   workers: Optional[int] = None) -> List[Dict]:
+        """
+        批量解析详情页（多进程）
+
+        解析是纯CPU工作且各页面相互独立，
+        用进程池并行可随核数近线性扩展
+
+        Args:
+            items: (html, url) 元组序列
+            workers: 进程数，默认为CPU核数
+
+        Returns:
+            与输入顺序一致的解析结果列表
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [self.parse(html, url) for html, url in items]
+
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                _parse_worker,
+                [html for html, _ in items],
+                [url for _, url in items],
+                chunksize=16,
+            ))
+
     def parse(self, html: str, url: str) -> Dict:
         """
         解析公告详情页
@@ -193,16 +419,17 @@ class DetailPageParser:
         if not html:
             return {}
 
-        soup = BeautifulSoup(html, 'lxml')
-
-        # 提取标题
-        title = self._extract_title(soup)
-
-        # 提取正文
-        content = self._extract_content(soup)
-
-        # 提取发布日期
-        publish_date = self._extract_publish_date(soup)
+        # 优先走lxml XPath，解析失败时回退到bs4
+        tree = _parse_html_tree(html)
+        if tree is not None:
+            title = self._extract_title_tree(tree)
+            content = self._extract_content_tree(tree)
+            publish_date = self._extract_publish_date(_text_without_chrome(tree))
+        else:
+            soup = BeautifulSoup(html, 'lxml')
+            title = self._extract_title(soup)
+            content = self._extract_content(soup)
+            publish_date = self._extract_publish_date(soup.get_text())
 
         result = {
             'url': url,
@@ -215,6 +442,36 @@ class DetailPageParser:
         logger.info(f"解析详情页: {title[:30]}...")
         return result
 
+    def _extract_title_tree(self, tree) -> str:
+        """提取标题（lxml XPath路径）"""
+        for xp in _TITLE_XPS:
+            for elem in xp(tree):
+                title = elem.text_content().strip()
+                if len(title) > 5:
+                    return title
+
+        return "未知标题"
+
+    def _extract_content_tree(self, tree) -> str:
+        """提取正文内容（lxml XPath路径）
+
+        只读遍历：收集文本时跳过script/style/nav等子树，
+        不再对整棵树做decompose/strip_elements手术
+        """
+        # 尝试找到正文容器
+        elems = _CONTENT_XP(tree)
+        if elems:
+            text = _text_without_chrome(elems[0])
+        else:
+            # 如果找不到特定容器，返回body的文本
+            body = tree.find('body')
+            if body is None:
+                return ""
+            text = _text_without_chrome(body)
+
+        lines = (line.strip() for line in text.splitlines())
+        return '\n'.join(line for line in lines if line)
+
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """提取标题"""
         # 尝试多种标题选择器
@@ -260,20 +517,6 @@ class DetailPageParser:
 
         return ""
 
-    def _extract_publish_date(self, soup: BeautifulSoup) -> Optional[str]:
-        """提取发布日期"""
-        # 查找包含日期的元素
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',
-            r'\d{4}\.\d{2}\.\d{2}',
-            r'\d{4}/\d{2}/\d{2}',
-            r'\d{4}年\d{1,2}月\d{1,2}日',
-        ]
-
-        text = soup.get_text()
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0)
-
-        return None
+    def _extract_publish_date(self, text: str) -> Optional[str]:
+        """从页面文本中提取发布日期"""
+        return _find_date(text)
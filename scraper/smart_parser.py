@@ -5,12 +5,21 @@
 import logging
 import re
 from typing import Dict, Optional
+from urllib.parse import urlparse
+
 from bs4 import BeautifulSoup
 
 from .ccgp_parser import CCGPAnnouncementParser
 
 logger = logging.getLogger(__name__)
 
+# 通用解析用的预编译正则
+# 日期合并为单个交替式：对整页文本扫描一次，
+# 不再按模式逐个 find_all(string=...) 遍历所有文本节点
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{4}年\d{1,2}月\d{1,2}日')
+_PHONE_RE = re.compile(r'1[3-9]\d{9}')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
 
 class SmartAnnouncementParser:
     """
@@ -37,6 +46,17 @@ class SmartAnnouncementParser:
             # 可以添加更多网站模式
         }
 
+        # 常见主机名直接查表（O(1)），通配模式预编译后只对主机名匹配
+        self._exact_hosts = {
+            'ccgp.gov.cn': 'ccgp',
+            'www.ccgp.gov.cn': 'ccgp',
+        }
+        self._host_patterns = [
+            (site_type, re.compile(pattern))
+            for site_type, patterns in self.site_patterns.items()
+            for pattern in patterns
+        ]
+
     def parse(self, html: str, url: str) -> Dict:
         """
         智能解析公告页面
@@ -76,12 +96,17 @@ class SmartAnnouncementParser:
         Returns:
             网站类型标识
         """
-        import re
+        host = urlparse(url).hostname or ''
 
-        for site_type, patterns in self.site_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, url):
-                    return site_type
+        # 精确主机名查表
+        site_type = self._exact_hosts.get(host)
+        if site_type:
+            return site_type
+
+        # 通配模式只对主机名匹配
+        for site_type, pattern in self._host_patterns:
+            if pattern.search(host):
+                return site_type
 
         # 默认返回ccgp类型（因为大部分公共资源交易网结构类似）
         return 'ccgp'
@@ -94,17 +119,20 @@ class SmartAnnouncementParser:
         """
         soup = BeautifulSoup(html, 'lxml')
 
+        # 整页文本只抽取一次，供日期和联系人提取共用
+        full_text = soup.get_text()
+
         result = {
             'url': url,
-            'meta': self._generic_parse_meta(soup),
+            'meta': self._generic_parse_meta(soup, full_text),
             'summary_table': {},
             'content_sections': {},
-            'contacts': self._generic_extract_contacts(soup),
+            'contacts': self._generic_extract_contacts(full_text),
         }
 
         return result
 
-    def _generic_parse_meta(self, soup: BeautifulSoup) -> Dict:
+    def _generic_parse_meta(self, soup: BeautifulSoup, full_text: str) -> Dict:
         """通用元数据解析"""
         meta = {}
 
@@ -124,21 +152,14 @@ class SmartAnnouncementParser:
                     meta['title'] = title
                     break
 
-        # 尝试提取日期
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',
-            r'\d{4}年\d{1,2}月\d{1,2}日',
-        ]
-
-        for pattern in date_patterns:
-            matches = soup.find_all(string=re.compile(pattern))
-            if matches:
-                meta['publish_date'] = matches[0].strip()
-                break
+        # 尝试提取日期（单次全文扫描）
+        match = _DATE_RE.search(full_text)
+        if match:
+            meta['publish_date'] = match.group(0)
 
         return meta
 
-    def _generic_extract_contacts(self, soup: BeautifulSoup) -> Dict:
+    def _generic_extract_contacts(self, full_text: str) -> Dict:
         """通用联系人提取"""
         contacts = {
             'buyer': {},
@@ -147,18 +168,14 @@ class SmartAnnouncementParser:
             'project': {},
         }
 
-        # 查找包含联系信息的文本
-        text = soup.get_text()
-
         # 提取电话
-        import re
-        phones = re.findall(r'1[3-9]\d{9}', text)
-        if phones:
-            contacts['project']['phone'] = phones[0]
+        phone = _PHONE_RE.search(full_text)
+        if phone:
+            contacts['project']['phone'] = phone.group(0)
 
         # 提取邮箱
-        emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', text)
-        if emails:
-            contacts['project']['email'] = emails[0]
+        email = _EMAIL_RE.search(full_text)
+        if email:
+            contacts['project']['email'] = email.group(0)
 
         return contacts
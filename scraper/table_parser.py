@@ -6,12 +6,121 @@ import logging
 from typing import List, Dict, Tuple, Optional
 from bs4 import BeautifulSoup, Tag
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+# 字段映射规则（表格键文本 -> (分类, 字段)）
+_FIELD_MAPPINGS = {
+    # 项目信息
+    '采购项目名称': ('project_info', 'name'),
+    '项目名称': ('project_info', 'name'),
+    '品目': ('project_info', 'category'),
+    '行政区域': ('project_info', 'region'),
+    '公告时间': ('project_info', 'publish_date'),
+    '公告日期': ('project_info', 'publish_date'),
+
+    # 采购人
+    '采购单位': ('buyer', 'name'),
+    '采购人': ('buyer', 'name'),
+    '采购单位地址': ('buyer', 'address'),
+    '采购人地址': ('buyer', 'address'),
+    '采购单位联系方式': ('buyer', 'contact'),
+    '采购人联系方式': ('buyer', 'contact'),
+
+    # 代理机构
+    '代理机构名称': ('agent', 'name'),
+    '代理机构': ('agent', 'name'),
+    '代理机构地址': ('agent', 'address'),
+    '代理机构联系方式': ('agent', 'contact'),
+
+    # 供应商（中标人）
+    '供应商名称': ('supplier', 'name'),
+    '中标人': ('supplier', 'name'),
+    '中标单位': ('supplier', 'name'),
+    '供应商地址': ('supplier', 'address'),
+    '中标人地址': ('supplier', 'address'),
+
+    # 金额
+    '总中标金额': ('amount', 'total'),
+    '中标金额': ('amount', 'bid'),
+    '成交金额': ('amount', 'bid'),
+
+    # 专家
+    '评审专家名单': ('experts', ''),
+    '评审专家': ('experts', ''),
+
+    # 联系人
+    '项目联系人': ('contacts', 'name'),
+    '项目联系电话': ('contacts', 'phone'),
+    '联系人': ('contacts', 'name'),
+    '联系电话': ('contacts', 'phone'),
+}
+
+
+class CellInfo:
+    """表格单元格信息
+
+    __slots__ 避免了每个单元格一个dict的分配和按键哈希查找
+    """
+    __slots__ = ('text', 'row', 'col', 'colspan', 'rowspan',
+                 'is_header', 'raw_element')
+
+    def __init__(self, text, row, col, colspan, rowspan, is_header, raw_element):
+        self.text = text
+        self.row = row
+        self.col = col
+        self.colspan = colspan
+        self.rowspan = rowspan
+        self.is_header = is_header
+        self.raw_element = raw_element
+
+
 class SmartTableParser:
     """智能表格解析器"""
 
+    def __init__(self):
+        # 模糊匹配预编译为Aho-Corasick自动机：
+        # 单次扫描键文本即可找出其中出现的所有映射模式，
+        # 替代逐模式的 `pattern in key` 循环
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for idx, (pattern, target) in enumerate(_FIELD_MAPPINGS.items()):
+                automaton.add_word(pattern, (idx, target))
+            automaton.make_automaton()
+            self._field_ac = automaton
+        else:
+            self._field_ac = None
+
+    def _match_field(self, key: str) -> Optional[Tuple[str, str]]:
+        """查找键文本对应的(分类, 字段)映射"""
+        # 精确匹配
+        target = _FIELD_MAPPINGS.get(key)
+        if target is not None:
+            return target
+
+        # 模糊匹配：模式是键的子串
+        if self._field_ac is not None:
+            hits = [value for _, value in self._field_ac.iter(key)]
+            if hits:
+                # 与原有遍历顺序保持一致：取映射表中最先定义的模式
+                return min(hits)[1]
+            # 剩余方向（键是模式的子串）单独兜底
+            for pattern, target in _FIELD_MAPPINGS.items():
+                if key in pattern:
+                    return target
+            return None
+
+        # 回退：逐模式扫描
+        for pattern, target in _FIELD_MAPPINGS.items():
+            if pattern in key or key in pattern:
+                return target
+        return None
+
     def parse_table(self, table: Tag) -> Dict:
         """
         解析表格，正确处理colspan和rowspan
@@ -22,14 +131,17 @@ class SmartTableParser:
         Returns:
             解析结果字典
         """
-        # 1. 构建二维网格，处理colspan和rowspan
-        grid = self._build_table_grid(table)
+        # 1. 构建一维扁平网格，处理colspan和rowspan
+        flat, n_rows, n_cols = self._build_table_grid(table)
 
         # 2. 解析为键值对
-        kv_data = self._parse_as_key_value(grid)
+        kv_data = self._parse_as_key_value(flat, n_rows, n_cols)
 
         # 3. 提取结构化信息
-        structured = self._extract_structured_data(grid, kv_data)
+        structured = self._extract_structured_data(kv_data)
+
+        # 对外仍暴露二维视图（切片共享单元格字典，开销很小）
+        grid = [flat[r * n_cols:(r + 1) * n_cols] for r in range(n_rows)]
 
         return {
             'grid': grid,
@@ -37,69 +149,84 @@ class SmartTableParser:
             'structured': structured,
         }
 
-    def _build_table_grid(self, table: Tag) -> List[List[Dict]]:
+    def _build_table_grid(self, table: Tag) -> Tuple[List[Optional["CellInfo"]], int, int]:
         """
-        构建表格二维网格
+        构建表格网格
 
-        处理colspan和rowspan，确保每个单元格在正确的位置
+        处理colspan和rowspan，确保每个单元格在正确的位置。
+        网格用一维扁平列表表示（索引 row * n_cols + col），
+        避免嵌套列表的逐行间接寻址。
 
         Returns:
-            二维列表，每个元素是单元格信息字典
+            (扁平单元格列表, 行数, 列数)
         """
         rows = table.find_all('tr')
         if not rows:
-            return []
+            return [], 0, 0
 
-        # 首先确定网格的列数
+        # 单次DOM遍历：缓存每行的单元格属性元组，
+        # 避免第二次 find_all / colspan / get_text 调用
+        rows_cells = []
         max_cols = 0
         for row in rows:
-            cells = row.find_all(['td', 'th'], recursive=False)
-            col_count = sum(int(cell.get('colspan', 1)) for cell in cells)
+            cells = [
+                (cell,
+                 int(cell.get('colspan', 1)),
+                 int(cell.get('rowspan', 1)),
+                 cell.get_text(strip=True))
+                for cell in row.find_all(['td', 'th'], recursive=False)
+            ]
+            col_count = sum(colspan for _, colspan, _, _ in cells)
             max_cols = max(max_cols, col_count)
+            rows_cells.append(cells)
 
-        # 初始化网格
-        grid = [[None for _ in range(max_cols)] for _ in range(len(rows))]
+        # 初始化扁平网格
+        n_rows = len(rows)
+        grid = [None] * (n_rows * max_cols)
 
         # 填充网格
-        for row_idx, row in enumerate(rows):
-            cells = row.find_all(['td', 'th'], recursive=False)
+        for row_idx, cells in enumerate(rows_cells):
+            base = row_idx * max_cols
             col_idx = 0
 
-            for cell in cells:
+            for cell, colspan, rowspan, text in cells:
                 # 找到第一个空位置
-                while col_idx < max_cols and grid[row_idx][col_idx] is not None:
+                while col_idx < max_cols and grid[base + col_idx] is not None:
                     col_idx += 1
 
                 if col_idx >= max_cols:
                     break
 
-                # 获取单元格属性
-                colspan = int(cell.get('colspan', 1))
-                rowspan = int(cell.get('rowspan', 1))
-                text = cell.get_text(strip=True)
-
                 # 创建单元格信息
-                cell_info = {
-                    'text': text,
-                    'row': row_idx,
-                    'col': col_idx,
-                    'colspan': colspan,
-                    'rowspan': rowspan,
-                    'is_header': cell.name == 'th' or 'title' in cell.get('class', []),
-                    'raw_element': cell,
-                }
+                cell_info = CellInfo(
+                    text=text,
+                    row=row_idx,
+                    col=col_idx,
+                    colspan=colspan,
+                    rowspan=rowspan,
+                    is_header=cell.name == 'th' or 'title' in cell.get('class', []),
+                    raw_element=cell,
+                )
+
+                # 普通单元格（无合并）直接落位，跳过range/min计算
+                if colspan == 1 and rowspan == 1:
+                    grid[base + col_idx] = cell_info
+                    col_idx += 1
+                    continue
 
                 # 填充到网格（考虑colspan和rowspan）
-                for r in range(row_idx, min(row_idx + rowspan, len(grid))):
+                for r in range(row_idx, min(row_idx + rowspan, n_rows)):
+                    r_base = r * max_cols
                     for c in range(col_idx, min(col_idx + colspan, max_cols)):
-                        if grid[r][c] is None:
-                            grid[r][c] = cell_info
+                        if grid[r_base + c] is None:
+                            grid[r_base + c] = cell_info
 
                 col_idx += colspan
 
-        return grid
+        return grid, n_rows, max_cols
 
-    def _parse_as_key_value(self, grid: List[List[Dict]]) -> Dict:
+    def _parse_as_key_value(self, flat: List[Optional["CellInfo"]],
+                            n_rows: int, n_cols: int) -> Dict:
         """
         将表格解析为键值对
 
@@ -110,15 +237,19 @@ class SmartTableParser:
         """
         result = {}
 
-        for row in grid:
-            if not row:
-                continue
+        for row_idx in range(n_rows):
+            base = row_idx * n_cols
+
+            # 该行首个单元格的来源行（rowspan延续的单元格row会更小）
+            first = flat[base]
+            first_row = first.row if first else row_idx
 
             # 找到第一个非空单元格作为键
             key_cell = None
             key_col = -1
-            for col_idx, cell in enumerate(row):
-                if cell and cell['text'] and cell['row'] == row[0]['row'] if row else True:
+            for col_idx in range(n_cols):
+                cell = flat[base + col_idx]
+                if cell and cell.text and cell.row == first_row:
                     key_cell = cell
                     key_col = col_idx
                     break
@@ -126,23 +257,23 @@ class SmartTableParser:
             if not key_cell:
                 continue
 
-            key = key_cell['text'].rstrip('：:')
+            key = key_cell.text.rstrip('：:')
 
             # 判断是否是分组标题（跨多列）
-            if key_cell['colspan'] > 2 or not key_cell.get('is_header', False):
+            if key_cell.colspan > 2 or not key_cell.is_header:
                 # 这可能是分组标题，跳过
                 continue
 
             # 获取值（下一列或后续列），避免重复
             value_parts = []
             seen_values = set()
-            for col_idx in range(key_col + 1, len(row)):
-                cell = row[col_idx]
-                if cell and cell['text'] and cell['row'] == row[0]['row']:
+            for col_idx in range(key_col + 1, n_cols):
+                cell = flat[base + col_idx]
+                if cell and cell.text and cell.row == first_row:
                     # 避免重复（相同内容只添加一次）
-                    if cell['text'] not in seen_values:
-                        value_parts.append(cell['text'])
-                        seen_values.add(cell['text'])
+                    if cell.text not in seen_values:
+                        value_parts.append(cell.text)
+                        seen_values.add(cell.text)
 
             value = ' '.join(value_parts).strip()
 
@@ -151,7 +282,7 @@ class SmartTableParser:
 
         return result
 
-    def _extract_structured_data(self, grid: List[List[Dict]], kv_data: Dict) -> Dict:
+    def _extract_structured_data(self, kv_data: Dict) -> Dict:
         """
         从表格中提取结构化数据
 
@@ -168,75 +299,19 @@ class SmartTableParser:
             'attachments': [],
         }
 
-        # 字段映射规则
-        field_mappings = {
-            # 项目信息
-            '采购项目名称': ('project_info', 'name'),
-            '项目名称': ('project_info', 'name'),
-            '品目': ('project_info', 'category'),
-            '行政区域': ('project_info', 'region'),
-            '公告时间': ('project_info', 'publish_date'),
-            '公告日期': ('project_info', 'publish_date'),
-
-            # 采购人
-            '采购单位': ('buyer', 'name'),
-            '采购人': ('buyer', 'name'),
-            '采购单位地址': ('buyer', 'address'),
-            '采购人地址': ('buyer', 'address'),
-            '采购单位联系方式': ('buyer', 'contact'),
-            '采购人联系方式': ('buyer', 'contact'),
-
-            # 代理机构
-            '代理机构名称': ('agent', 'name'),
-            '代理机构': ('agent', 'name'),
-            '代理机构地址': ('agent', 'address'),
-            '代理机构联系方式': ('agent', 'contact'),
-
-            # 供应商（中标人）
-            '供应商名称': ('supplier', 'name'),
-            '中标人': ('supplier', 'name'),
-            '中标单位': ('supplier', 'name'),
-            '供应商地址': ('supplier', 'address'),
-            '中标人地址': ('supplier', 'address'),
-
-            # 金额
-            '总中标金额': ('amount', 'total'),
-            '中标金额': ('amount', 'bid'),
-            '成交金额': ('amount', 'bid'),
-
-            # 专家
-            '评审专家名单': ('experts', ''),
-            '评审专家': ('experts', ''),
-
-            # 联系人
-            '项目联系人': ('contacts', 'name'),
-            '项目联系电话': ('contacts', 'phone'),
-            '联系人': ('contacts', 'name'),
-            '联系电话': ('contacts', 'phone'),
-        }
-
-        # 应用映射
+        # 应用映射（精确匹配 + 自动机模糊匹配）
         for key, value in kv_data.items():
-            # 精确匹配
-            if key in field_mappings:
-                category, field = field_mappings[key]
-                if category == 'experts':
-                    structured[category] = value
-                elif category == 'attachments':
-                    structured[category].append({'name': value})
-                else:
-                    structured[category][field] = value
+            target = self._match_field(key)
+            if target is None:
+                continue
+
+            category, field = target
+            if category == 'experts':
+                structured[category] = value
+            elif category == 'attachments':
+                structured[category].append({'name': value})
             else:
-                # 模糊匹配
-                for pattern, (category, field) in field_mappings.items():
-                    if pattern in key or key in pattern:
-                        if category == 'experts':
-                            structured[category] = value
-                        elif category == 'attachments':
-                            structured[category].append({'name': value})
-                        else:
-                            structured[category][field] = value
-                        break
+                structured[category][field] = value
 
         return structured
 
@@ -282,24 +357,24 @@ class SmartTableParser:
             'complexity': 'high' if (has_colspan and has_rowspan) else 'medium' if (has_colspan or has_rowspan) else 'simple',
         }
 
-    def visualize_grid(self, grid: List[List[Dict]]) -> str:
+    def visualize_grid(self, grid: List[List[Optional["CellInfo"]]]) -> str:
         """
         可视化表格网格（用于调试）
 
         Returns:
             表格的文本表示
         """
-        lines = []
-        for row in grid:
-            row_text = []
-            for cell in row:
-                if cell:
-                    # 显示单元格信息
-                    marker = '*' if cell.get('is_header') else ''
-                    colspan = f"[{cell['colspan']}]" if cell['colspan'] > 1 else ''
-                    text = cell['text'][:20]
-                    row_text.append(f"{marker}{text}{colspan}")
-                else:
-                    row_text.append("空")
-            lines.append(" | ".join(row_text))
-        return "\n".join(lines)
+        # 生成器直接喂给join，省去逐行/逐格的中间列表
+        return "\n".join(
+            " | ".join(self._format_cell(cell) for cell in row)
+            for row in grid
+        )
+
+    @staticmethod
+    def _format_cell(cell: Optional["CellInfo"]) -> str:
+        """单元格的调试文本表示"""
+        if cell is None:
+            return "空"
+        marker = '*' if cell.is_header else ''
+        colspan = f"[{cell.colspan}]" if cell.colspan > 1 else ''
+        return f"{marker}{cell.text[:20]}{colspan}"
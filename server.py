@@ -11,14 +11,16 @@ if getattr(sys, 'frozen', False):
     internal_dir = os.path.join(bundle_dir, '_internal')
     if os.path.isdir(internal_dir):
         base_path = internal_dir
-        # Ensure DLLs in _internal can be found by Python 3.8+
+        # Ensure DLLs in _internal can be found by Python 3.8+.
+        # Deliberately NOT prepended to PATH: os.environ["PATH"] is
+        # inherited by every worker subprocess we spawn and lengthens
+        # their DLL search, while add_dll_directory only affects this
+        # process.
         if hasattr(os, 'add_dll_directory'):
             try:
                 os.add_dll_directory(internal_dir)
             except Exception:
                 pass
-        # Add to PATH as well for generic DLL searching
-        os.environ["PATH"] = internal_dir + os.pathsep + os.environ.get("PATH", "")
     else:
         base_path = bundle_dir
     
@@ -41,66 +43,121 @@ if getattr(sys, 'frozen', False):
 
 import main as app_worker
 import asyncio
+import collections
+import hashlib
+import itertools
 import logging
+import operator
+import re
 import subprocess
+import tempfile
 import threading
+import time
 import queue
 from typing import List, Optional
 
-from contextlib import asynccontextmanager
-from fastapi import FastAPI, WebSocket, Query
+from contextlib import asynccontextmanager, contextmanager
+from fastapi import FastAPI, Request, WebSocket, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# orjson serializes JSON in native code, several times faster than the
+# stdlib — use it for all API responses when available
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as _DefaultJSONResponse
+except ImportError:
+    orjson = None
+    _DefaultJSONResponse = JSONResponse
 import sqlite3
+
+# No Python callbacks (functions/collations/hooks) are registered on our
+# connections; skipping traceback capture trims a little per-call overhead.
+sqlite3.enable_callback_tracebacks(False)
 import zipfile
 from io import BytesIO
 from storage import Database
-import license_utils
-
-# Access State
-HAS_ACCESS = False
-ACCESS_STATE = {"locked": True, "mode": "locked"}
-
-
-def refresh_access_state():
-    global HAS_ACCESS, ACCESS_STATE
-    ACCESS_STATE = license_utils.get_access_status()
-    HAS_ACCESS = not ACCESS_STATE.get("locked", True)
-
-    if ACCESS_STATE.get("licensed"):
-        print("[License] App is unlocked with a valid license.")
-    elif ACCESS_STATE.get("trial_active"):
-        print(
-            f"[Trial] Trial mode active, {ACCESS_STATE.get('trial_days_left', 0)} day(s) remaining."
-        )
-    else:
-        print("[License] No valid license or trial found. App is LOCKED.")
-
-    return ACCESS_STATE
+import license_utils
+
+# Access State
+HAS_ACCESS = False
+ACCESS_STATE = {"locked": True, "mode": "locked"}
+
+# Re-deriving the access state means license file reads, an Ed25519
+# verify and trial-record checks — too heavy for the per-request
+# middleware. Cache it briefly, invalidating as soon as the license
+# file's mtime changes so activating a key takes effect immediately.
+_ACCESS_TTL = 5.0
+_ACCESS_CACHE = {"t": 0.0, "mtime": None, "state": None}
+
+
+def _license_mtime():
+    try:
+        return os.stat(license_utils.LICENSE_FILE).st_mtime
+    except OSError:
+        return None
+
+
+def refresh_access_state(force=False):
+    global HAS_ACCESS, ACCESS_STATE
+    now = time.monotonic()
+    mtime = _license_mtime()
+    if (not force and _ACCESS_CACHE["state"] is not None
+            and mtime == _ACCESS_CACHE["mtime"]
+            and now - _ACCESS_CACHE["t"] < _ACCESS_TTL):
+        return _ACCESS_CACHE["state"]
+
+    ACCESS_STATE = license_utils.get_access_status()
+    HAS_ACCESS = not ACCESS_STATE.get("locked", True)
+    _ACCESS_CACHE["t"] = now
+    _ACCESS_CACHE["mtime"] = mtime
+    _ACCESS_CACHE["state"] = ACCESS_STATE
+
+    if ACCESS_STATE.get("licensed"):
+        print("[License] App is unlocked with a valid license.")
+    elif ACCESS_STATE.get("trial_active"):
+        print(
+            f"[Trial] Trial mode active, {ACCESS_STATE.get('trial_days_left', 0)} day(s) remaining."
+        )
+    else:
+        print("[License] No valid license or trial found. App is LOCKED.")
+
+    return ACCESS_STATE
 
 # Global state for the running process
 class ProcessManager:
     def __init__(self):
         self.process = None
         self.lock = threading.Lock()
-        self.output_queue = queue.Queue()
+        # SPSC handoff reader thread -> websocket task: deque append/pop
+        # are atomic under the GIL so the producer never takes a lock,
+        # maxlen bounds memory if scan output outruns the client, and the
+        # event (set via call_soon_threadsafe; loop captured in lifespan)
+        # wakes the consumer without polling.
+        self.loop = None
+        self.buffer = collections.deque(maxlen=4096)
+        self.data_event = asyncio.Event()
         self.is_running = False
 
+    def _publish(self, line: str):
+        self.buffer.append(line)
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.data_event.set)
+
     def start_process(self, command: List[str]):
         with self.lock:
             if self.is_running:
                 raise Exception("A scan is already running")
             
             self.is_running = True
-            # Use line buffering
+            # Binary pipe: the reader pulls 64KB bursts with os.read
+            # instead of one buffered readline per line
             self.process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
                 cwd=os.path.dirname(os.path.abspath(__file__))
             )
             
@@ -111,18 +168,35 @@ class ProcessManager:
         try:
             if not self.process:
                 return
-                
-            for line in iter(self.process.stdout.readline, ''):
-                self.output_queue.put(line)
-                
+
+            # One blocking os.read per burst instead of one readline per
+            # line: a chatty scan costs 1 syscall per pipe buffer, and a
+            # partial trailing line is flushed at EOF. (A select() loop
+            # would buy nothing here — this thread exists to block, and
+            # select on pipes is not portable to Windows.)
+            fd = self.process.stdout.fileno()
+            pending = bytearray()
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                pending += chunk
+                if b'\n' not in chunk:
+                    continue
+                head, _, pending_tail = pending.rpartition(b'\n')
+                self._publish(head.decode('utf-8', errors='replace') + '\n')
+                pending = bytearray(pending_tail)
+            if pending:
+                self._publish(pending.decode('utf-8', errors='replace') + '\n')
+
             self.process.stdout.close()
             self.process.wait()
         except Exception as e:
-            self.output_queue.put(f"Error reading output: {e}\n")
+            self._publish(f"Error reading output: {e}\n")
         finally:
             with self.lock:
                 self.is_running = False
-            self.output_queue.put("[Process Completed]\n")
+            self._publish("[Process Completed]\n")
 
     def kill_process(self):
         with self.lock:
@@ -133,15 +207,29 @@ class ProcessManager:
 process_manager = ProcessManager()
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
-    # Initialize DB tables on startup
-    Database()
-    refresh_access_state()
-    yield
-    # Clean up (if needed)
+async def lifespan(app: FastAPI):
+    global db_read_pool, db_write_pool
+    # Capture the running loop so the log reader thread can hand lines
+    # over to the websocket queue
+    process_manager.loop = asyncio.get_running_loop()
+    # Initialize DB tables on startup
+    Database()
+    refresh_access_state()
+    # Warm up the shared connection pools
+    get_read_pool()
+    get_write_pool()
+    yield
+    # Clean up
+    if db_read_pool is not None:
+        db_read_pool.close_all()
+        db_read_pool = None
+    if db_write_pool is not None:
+        db_write_pool.close_all()
+        db_write_pool = None
 
 # Initialize FastAPI app
-app = FastAPI(title="Bidding Scraper UI", lifespan=lifespan)
+app = FastAPI(title="Bidding Scraper UI", lifespan=lifespan,
+              default_response_class=_DefaultJSONResponse)
 
 # Mount static files (Web UI)
 # We expect 'web' folder at the root (bundle_dir)
@@ -149,12 +237,43 @@ web_dir = os.path.join(os.environ.get("APP_BASE_PATH", "."), "web")
 if os.path.exists(web_dir):
     app.mount("/static", StaticFiles(directory=web_dir), name="static")
     
-    # Serve index.html for root
+    # Serve index.html for root. The file is static for the life of the
+    # process (frozen builds unpack it once), so read it into memory on
+    # first hit and answer revalidation with 304 instead of re-opening
+    # and re-sending it per request.
+    _index_cache = {"bytes": None, "etag": None}
+
     @app.get("/")
-    async def read_root():
-        return FileResponse(os.path.join(web_dir, "index.html"))
+    async def read_root(request: Request):
+        if _index_cache["bytes"] is None:
+            with open(os.path.join(web_dir, "index.html"), "rb") as f:
+                _index_cache["bytes"] = f.read()
+            _index_cache["etag"] = '"%s"' % hashlib.md5(_index_cache["bytes"]).hexdigest()
+
+        etag = _index_cache["etag"]
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(
+            content=_index_cache["bytes"],
+            media_type="text/html",
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
 
 
+# Compress large JSON responses (list endpoints shrink 5-10x). The
+# export downloads are already deflate-compressed containers, so they
+# are excluded by content type: starlette skips application/zip out of
+# the box but not the xlsx media type, which must be listed explicitly
+# or every workbook download pays a pointless zlib pass.
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
+app.add_middleware(
+    GZipMiddleware, minimum_size=1024, compresslevel=4,
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+)
+
 # Allow CORS (useful for dev)
 app.add_middleware(
     CORSMiddleware,
@@ -164,23 +283,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Paths the license middleware lets through: static files, auth
+# endpoints, and docs. startswith/endswith accept a tuple and check all
+# alternatives in one C call — this runs on every request.
+_OPEN_PREFIXES = ("/api/auth", "/static")
+_OPEN_SUFFIXES = (".js", ".css", "favicon.ico")
+
 @app.middleware("http")
-async def check_license_middleware(request, call_next):
-    # Allow static files, auth endpoints, and docs
-    path = request.url.path
-    if path.startswith("/api/auth") or path.startswith("/static") or path == "/" or path.endswith(".js") or path.endswith(".css") or path.endswith("favicon.ico"):
-        return await call_next(request)
-
-    current_access = refresh_access_state()
-
-    # Block other API calls if not licensed
-    if path.startswith("/api/") and current_access.get("locked"):
-        return JSONResponse(status_code=403, content={"error": "License required", "locked": True})
-        
-    return await call_next(request)
+async def check_license_middleware(request, call_next):
+    path = request.url.path
+    if path == "/" or path.startswith(_OPEN_PREFIXES) or path.endswith(_OPEN_SUFFIXES):
+        return await call_next(request)
+
+    current_access = refresh_access_state()
+
+    # Block other API calls if not licensed
+    if path.startswith("/api/") and current_access.get("locked"):
+        return JSONResponse(status_code=403, content={"error": "License required", "locked": True})
+        
+    return await call_next(request)
+
+# Keyword separators: half/full-width commas and runs of whitespace.
+# Precompiled once; the regex engine splits in C instead of a Python
+# strip-and-filter loop per request.
+_KW_SPLIT = re.compile(r'[,，\s]+')
 
 # Models
+# pydantic v2 config: whitespace-stripping and unknown-field dropping
+# happen inside the compiled Rust validators instead of handler code,
+# and frozen models skip per-instance __dict__ mutation support
 class SearchRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, extra='ignore', frozen=True)
+
     keywords: str
     search_type: str = "fulltext"
     pinmu: str = "all"
@@ -192,35 +326,147 @@ class SearchRequest(BaseModel):
     end_date: Optional[str] = None
 
 # Database helper
-from config.settings import DB_PATH
-def get_db_connection():
-    # Use config.settings.DB_PATH for consistency
+from config.settings import DB_PATH, EXPORT_DIR
+
+class SQLitePool:
+    """Bounded pool of pre-opened SQLite connections.
+
+    Opening a fresh connection per request re-reads the schema and starts
+    with a cold page cache; checking warm connections in and out of a
+    queue keeps that cost one-time.
+    """
+
+    def __init__(self, db_path: str, size: int = 8, readonly: bool = False):
+        self.db_path = db_path
+        self.readonly = readonly
+        self._pool = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(self._open())
+
+    # Applied once per pooled connection: WAL lets readers run while a
+    # scan writes, NORMAL sync drops per-write fsyncs, and the 64 MB page
+    # cache / mmap keep hot pages in memory across requests.
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA busy_timeout=30000",
+    )
+
+    def _open(self):
+        # isolation_level=None -> autocommit: no implicit transaction is
+        # opened behind our back, and explicit BEGIN/COMMIT still works
+        # where a statement batch needs one
+        if self.readonly:
+            # mode=ro connections can never take the write lock, so N of
+            # them run truly in parallel under WAL
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True,
+                check_same_thread=False, isolation_level=None)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            # journal/sync modes are writer-side settings
+            if self.readonly and ("journal_mode" in pragma or "synchronous" in pragma):
+                continue
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def acquire(self, timeout: float = 30):
+        conn = self._pool.get(timeout=timeout)
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close_all(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# SQLite serializes writes at the file level; under WAL the optimal
+# layout is one writer connection plus N parallel readers.
+db_read_pool: Optional[SQLitePool] = None
+db_write_pool: Optional[SQLitePool] = None
+
+def _ensure_db_file() -> str:
     db_path = str(DB_PATH)
     # Ensure directory exists (though Database() init should have done it)
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    
-    print(f"[DEBUG] Connecting to DB at: {db_path}")
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+    if not os.path.exists(db_path):
+        Database()
+    return db_path
+
+def get_read_pool() -> SQLitePool:
+    global db_read_pool
+    if db_read_pool is None:
+        db_read_pool = SQLitePool(
+            _ensure_db_file(), size=os.cpu_count() or 4, readonly=True)
+    return db_read_pool
+
+def get_write_pool() -> SQLitePool:
+    global db_write_pool
+    if db_write_pool is None:
+        db_write_pool = SQLitePool(_ensure_db_file(), size=1)
+    return db_write_pool
+
+# Endpoints are async but sqlite3 calls block; running them on the event
+# loop stalls every other request and websocket. Queries run on this
+# executor instead, sized to match the read pool.
+import concurrent.futures
+
+db_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+def get_db_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global db_executor
+    if db_executor is None:
+        db_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=(os.cpu_count() or 4) + 1,
+            thread_name_prefix="db")
+    return db_executor
+
+# Gate DB dispatch to the read pool's actual parallelism: a burst of
+# requests then queues cheaply in the event loop instead of piling
+# threads onto connections that would only block each other.
+_db_sem: Optional[asyncio.Semaphore] = None
+
+def _get_db_sem() -> asyncio.Semaphore:
+    global _db_sem
+    if _db_sem is None:
+        _db_sem = asyncio.Semaphore(os.cpu_count() or 4)
+    return _db_sem
+
+async def run_db(func, *args):
+    """Run a blocking DB helper off the event loop."""
+    async with _get_db_sem():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_db_executor(), func, *args)
 
 # API Endpoints
 
 class LicenseKey(BaseModel):
     key: str
 
-@app.get("/api/auth/status")
-async def get_auth_status():
-    return refresh_access_state()
-
-@app.post("/api/auth/verify")
-async def verify_auth_key(body: LicenseKey):
-    code = license_utils.get_machine_code()
-    if license_utils.verify_license(code, body.key):
-        license_utils.save_license(body.key)
-        refresh_access_state()
-        return {"success": True}
-    return JSONResponse(status_code=400, content={"error": "Invalid License Key", "success": False})
+@app.get("/api/auth/status")
+async def get_auth_status():
+    return refresh_access_state()
+
+@app.post("/api/auth/verify")
+async def verify_auth_key(body: LicenseKey):
+    code = license_utils.get_machine_code()
+    if license_utils.verify_license(code, body.key):
+        license_utils.save_license(body.key)
+        refresh_access_state(force=True)
+        return {"success": True}
+    return JSONResponse(status_code=400, content={"error": "Invalid License Key", "success": False})
 
 @app.post("/api/search")
 async def start_search(req: SearchRequest):
@@ -236,7 +482,7 @@ async def start_search(req: SearchRequest):
              cmd = [sys.executable, "server.py", "bxsearch"]
         
         # Handle keywords (comma separated)
-        kw_list = [k.strip() for k in req.keywords.split(",") if k.strip()]
+        kw_list = [k for k in _KW_SPLIT.split(req.keywords) if k]
         if not kw_list:
              return JSONResponse(status_code=400, content={"error": "Keywords required"})
         
@@ -276,125 +522,411 @@ async def get_status():
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
     try:
+        buffer = process_manager.buffer
+        data_event = process_manager.data_event
         while True:
-            # Non-blocking get from queue
-            try:
-                # Flush all available lines
-                lines = []
-                while True:
-                    line = process_manager.output_queue.get_nowait()
-                    lines.append(line)
-            except queue.Empty:
-                pass
-            
-            if lines:
-                await websocket.send_text("".join(lines))
-            
-            await asyncio.sleep(0.1)
+            # Block until lines arrive — no polling, no sleep latency.
+            # Clear before draining so a line published mid-drain leaves
+            # the event set for the next iteration.
+            await data_event.wait()
+            data_event.clear()
+            buf = []
+            while buffer:
+                buf.append(buffer.popleft())
+            if buf:
+                # Coalesce the burst into one frame: one send per burst
+                # instead of one per line
+                await websocket.send_text("".join(buf))
     except Exception:
         pass
 
-@app.get("/api/stats")
-async def get_stats():
-    try:
-        conn = get_db_connection()
+def _rows_as_dicts(cursor):
+    """Stream cursor rows as dicts without fetchall() buffering.
+
+    dict(sqlite3.Row) re-walks the column description for every row;
+    resolving the key list once and zipping keeps the per-row work in C.
+    """
+    keys = [c[0] for c in cursor.description]
+    for row in cursor:
+        yield dict(zip(keys, row))
+
+
+def _query_stats():
+    with get_read_pool().acquire() as conn:
         cursor = conn.cursor()
-        
+
         cursor.execute("SELECT COUNT(*) FROM announcements")
         total_announcements = cursor.fetchone()[0]
-        
+
         cursor.execute("SELECT COUNT(*) FROM business_cards")
         total_cards = cursor.fetchone()[0]
-        
+
         # Top 5 companies by project count (number of announcements)
         # 排除无效的公司名称（如"详见公告正文"、"详见正文"等占位文本）
         cursor.execute("""
-            SELECT bc.company, COUNT(DISTINCT bcm.announcement_id) as count 
+            SELECT bc.company, COUNT(DISTINCT bcm.announcement_id) as count
             FROM business_cards bc
             JOIN business_card_mentions bcm ON bcm.business_card_id = bc.id
             WHERE bc.company NOT LIKE '%详见%正文%'
               AND bc.company NOT LIKE '%见公告%'
               AND bc.company NOT LIKE '%见附件%'
               AND LENGTH(bc.company) > 2
-            GROUP BY bc.company 
-            ORDER BY count DESC 
+            GROUP BY bc.company
+            ORDER BY count DESC
             LIMIT 5
         """)
-        top_companies = [dict(row) for row in cursor.fetchall()]
-        
+        top_companies = list(_rows_as_dicts(cursor))
+
         # 角色分布统计（用于调试）
         cursor.execute("""
-            SELECT role, COUNT(*) as count 
-            FROM business_card_mentions 
+            SELECT role, COUNT(*) as count
+            FROM business_card_mentions
             GROUP BY role
         """)
-        role_stats = [dict(row) for row in cursor.fetchall()]
-        
-        return {
-            "total_announcements": total_announcements,
-            "total_cards": total_cards,
-            "top_companies": top_companies,
-            "role_distribution": role_stats
-        }
+        role_stats = list(_rows_as_dicts(cursor))
+
+    return {
+        "total_announcements": total_announcements,
+        "total_cards": total_cards,
+        "top_companies": top_companies,
+        "role_distribution": role_stats
+    }
+
+# Short TTL cache for /api/stats: the UI polls it but the data only
+# changes at scan granularity. The lock coalesces concurrent misses so a
+# burst of clients triggers a single DB roundtrip.
+_STATS_TTL = 5.0
+_stats_cache = {"t": 0.0, "v": None}
+_stats_lock = asyncio.Lock()
+
+@app.get("/api/stats")
+async def get_stats():
+    try:
+        if time.monotonic() - _stats_cache["t"] < _STATS_TTL:
+            return _stats_cache["v"]
+        async with _stats_lock:
+            # Re-check: another request may have refreshed while we waited
+            if time.monotonic() - _stats_cache["t"] < _STATS_TTL:
+                return _stats_cache["v"]
+            stats = await run_db(_query_stats)
+            _stats_cache["v"] = stats
+            _stats_cache["t"] = time.monotonic()
+            return stats
     except Exception as e:
         return {"error": str(e)}
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
-@app.get("/api/announcements")
-async def get_announcements(limit: int = 50, offset: int = 0, q: str = "", province: str = ""):
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Build WHERE clause
-        where_parts = []
-        params = []
-        
-        if q:
+# SQL text cache for the paginated announcement query, keyed by filter
+# shape. sqlite3 keeps compiled statements per connection keyed on the
+# exact SQL string, so handing back the same string object for a given
+# shape skips both Python string formatting and SQLite re-preparation.
+_ANN_SQL_CACHE = {}
+
+def _announcements_sql(use_fts: bool, has_q: bool, has_province: bool,
+                       keyset: bool):
+    key = (use_fts, has_q, has_province, keyset)
+    cached = _ANN_SQL_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    where_parts = []
+    fts_join = ""
+    if use_fts:
+        fts_join = "JOIN announcements_fts f ON f.rowid = announcements.id"
+        where_parts.append("announcements_fts MATCH ?")
+    else:
+        if has_q:
             where_parts.append("(title LIKE ? OR content LIKE ?)")
-            params.extend([f"%{q}%", f"%{q}%"])
-        
-        if province:
+        if has_province:
             # 按省份筛选（从标题或内容中匹配）
             where_parts.append("(title LIKE ? OR content LIKE ?)")
+
+    if keyset:
+        # Seek (keyset) pagination: continue strictly after the cursor
+        # row. The covering index on (publish_date DESC, id, ...) makes
+        # this O(limit) at any depth, unlike OFFSET's scan-and-discard.
+        where_parts.append("(publish_date, announcements.id) < (?, ?)")
+
+    where_clause = " AND ".join(where_parts) if where_parts else "1=1"
+    paging = "LIMIT ?" if keyset else "LIMIT ? OFFSET ?"
+
+    # Count and page in one round-trip: the window function is evaluated
+    # over the full filtered set before LIMIT applies, so the filter is
+    # only scanned once
+    data_sql = f"""
+        SELECT announcements.id, announcements.title, url, publish_date, source,
+               COUNT(*) OVER () AS _total
+        FROM announcements
+        {fts_join}
+        WHERE {where_clause}
+        ORDER BY publish_date DESC, announcements.id DESC
+        {paging}
+    """
+    count_sql = f"SELECT COUNT(*) FROM announcements {fts_join} WHERE {where_clause}"
+
+    _ANN_SQL_CACHE[key] = (data_sql, count_sql)
+    return data_sql, count_sql
+
+def _query_announcements(limit: int, offset: int, q: str, province: str,
+                         after_date: str = "", after_id: int = 0,
+                         _force_like: bool = False):
+    # Searches go through the FTS5 trigram index (see Database._init_db)
+    # — leading-% LIKE scans the whole table, MATCH walks an inverted
+    # index. Trigram needs >=3 chars per term, so short queries and
+    # legacy DB files without the index fall back to LIKE.
+    params = []
+    keyset = bool(after_date)
+
+    terms = [t for t in (q, province) if t]
+    use_fts = bool((not _force_like) and terms and all(len(t) >= 3 for t in terms))
+
+    if use_fts:
+        match = " AND ".join('"%s"' % t.replace('"', '""') for t in terms)
+        params.append(match)
+    else:
+        if q:
+            params.extend([f"%{q}%", f"%{q}%"])
+        if province:
             params.extend([f"%{province}%", f"%{province}%"])
-        
-        where_clause = " AND ".join(where_parts) if where_parts else "1=1"
-        
-        # Get total count
-        count_sql = f"SELECT COUNT(*) FROM announcements WHERE {where_clause}"
-        cursor.execute(count_sql, params)
-        total = cursor.fetchone()[0]
-        
-        # Get data
-        data_sql = f"""
-            SELECT id, title, url, publish_date, source 
-            FROM announcements 
-            WHERE {where_clause}
-            ORDER BY publish_date DESC 
-            LIMIT ? OFFSET ?
-        """
-        cursor.execute(data_sql, params + [limit, offset])
-        
-        return {
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-            "items": [dict(row) for row in cursor.fetchall()]
-        }
+
+    if keyset:
+        params.extend([after_date, after_id])
+        paging_params = [limit]
+    else:
+        paging_params = [limit, offset]
+
+    data_sql, count_sql = _announcements_sql(use_fts, bool(q), bool(province), keyset)
+
+    try:
+        with get_read_pool().acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(data_sql, params + paging_params)
+            items = list(_rows_as_dicts(cursor))
+
+            if items:
+                total = items[0].pop("_total")
+                for item in items[1:]:
+                    del item["_total"]
+            elif not keyset and offset > 0:
+                # Page past the end — still need the true total
+                cursor.execute(count_sql, params)
+                total = cursor.fetchone()[0]
+            else:
+                total = 0
+
+            result = {
+                "total": total,
+                "limit": limit,
+                "offset": offset,
+                "items": items
+            }
+            # Cursor for the next seek page (null when exhausted)
+            if keyset:
+                if len(items) == limit:
+                    last = items[-1]
+                    result["next_cursor"] = {
+                        "after_date": last["publish_date"],
+                        "after_id": last["id"],
+                    }
+                else:
+                    result["next_cursor"] = None
+            return result
+    except sqlite3.OperationalError:
+        # DB file predates the FTS index — rerun with the LIKE plan
+        if use_fts:
+            return _query_announcements(limit, offset, q, province,
+                                        after_date, after_id, _force_like=True)
+        raise
+
+@app.get("/api/announcements")
+async def get_announcements(limit: int = 50, offset: int = 0, q: str = "", province: str = "",
+                            after_date: str = "", after_id: int = 0):
+    try:
+        return await run_db(_query_announcements, limit, offset, q, province,
+                            after_date, after_id)
     except Exception as e:
         return {"error": str(e)}
+
+# 分省导出的分桶在SQL里完成：31个instr由SQLite的C代码逐行求值，
+# 替代Python里每行31次子串扫描
+_EXPORT_PROVINCES = ("北京", "上海", "广东", "江苏", "浙江", "山东", "河南", "四川", "湖北", "湖南", "福建", "安徽", "河北", "陕西", "江西", "重庆", "辽宁", "云南", "广西", "山西", "贵州", "天津", "新疆", "内蒙古", "黑龙江", "吉林", "甘肃", "海南", "宁夏", "青海", "西藏")
+
+# 只扫title：省份名在标题里基本都会出现，按正文分桶意味着每行都要
+# 把整个content页读出来，带宽开销远大于收益
+_PROVINCE_BUCKET_SQL = "CASE " + " ".join(
+    f"WHEN instr(title, '{p}') > 0 THEN '{p}'"
+    for p in _EXPORT_PROVINCES
+) + " ELSE '其他' END"
+
+_DAY_BUCKET_SQL = (
+    "CASE WHEN publish_date IS NULL OR publish_date = '' THEN 'Unknown' "
+    "ELSE substr(publish_date, 1, 10) END"
+)
+
+def _iter_and_close(buffer, chunk_size=65536):
+    """Yield a file-like object in fixed-size chunks, closing it at the end.
+
+    Handing the file object itself to StreamingResponse would iterate it
+    line-by-line (it's a binary file), producing arbitrary split points;
+    this keeps frames at 64 KB and releases the spooled temp file."""
+    try:
+        while True:
+            chunk = buffer.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
     finally:
-        if 'conn' in locals():
-            conn.close()
+        buffer.close()
+
+
+def _build_announcements_export(where_clause, params, export_type, include_details_bool):
+    """Run the export query and build the xlsx/zip payload.
+
+    The whole pipeline (SELECT + openpyxl build + zip) is synchronous and
+    CPU/IO heavy, so it runs on the DB executor via run_db — a large
+    export no longer freezes the websocket log stream or other requests.
+    Returns (buffer, media_type, filename) or None when nothing matched.
+    """
+    import openpyxl
+    from openpyxl.utils import get_column_letter
+
+    # 分组导出时由SQLite直接计算分桶标签
+    if export_type == "province":
+        bucket_col = f", {_PROVINCE_BUCKET_SQL} AS bucket"
+    elif export_type == "day":
+        bucket_col = f", {_DAY_BUCKET_SQL} AS bucket"
+    else:
+        bucket_col = ""
+
+    # content正文通常是每行KB级，不导出详情时根本不选它，
+    # SQLite也就不用读溢出页
+    content_col = ", content" if include_details_bool else ""
+    sql = f"""
+        SELECT title, url, publish_date, source{content_col}{bucket_col}
+        FROM announcements
+        WHERE {where_clause}
+        ORDER BY publish_date DESC
+    """
+
+    # Shape each sqlite3.Row into the output tuple once, during cursor
+    # iteration — no intermediate dicts or cell objects are kept around.
+    if include_details_bool:
+        # If including details, HIDE Source and Link (as requested)
+        headers = ("发布时间", "标题", "详情")
+        widths = (20, 60, 80)
+
+        def row_tuple(row):
+            content = str(row['content'] or '')
+            if len(content) > 32000:
+                content = content[:32000] + "..."
+            return (str(row['publish_date'] or ''), str(row['title'] or ''), content)
+    else:
+        headers = ("发布时间", "标题", "来源", "链接")
+        widths = (20, 60, 25, 40)
+
+        def row_tuple(row):
+            return (str(row['publish_date'] or ''), str(row['title'] or ''),
+                    str(row['source'] or ''), str(row['url'] or ''))
+
+    # Helper to create excel sheet (write-only workbooks: widths must be
+    # set before any row is appended)
+    def create_sheet(wb, title, data):
+        ws = wb.create_sheet(title=title[:30])  # Sheet name limit 31 chars
+        for idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(idx)].width = width
+        ws.append(headers)
+        for item in data:
+            ws.append(item)
+
+    if export_type == "all":
+        # Stream the cursor straight into a write-only workbook: peak
+        # memory is one row, not the whole result set. The xlsx itself
+        # spools to disk once it outgrows 32 MB.
+        output = tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024)
+        with get_read_pool().acquire() as conn:
+            cursor = conn.execute(sql, params)
+            first = cursor.fetchone()
+            if first is None:
+                output.close()
+                return None
+
+            wb = openpyxl.Workbook(write_only=True)
+            create_sheet(wb, "公告列表",
+                         map(row_tuple, itertools.chain((first,), cursor)))
+            wb.save(output)
+
+        output.seek(0)
+        return (
+            output,
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            f"announcements_{export_type}.xlsx",
+        )
+
+    # Grouped exports need the full partition before workbooks can be
+    # written, but only as compact tuples keyed by the SQL bucket label.
+    if export_type == "province":
+        # Preserve the canonical province order in the archive
+        grouped = {p: [] for p in _EXPORT_PROVINCES}
+        grouped["其他"] = []
+        filename = "announcements_by_province.zip"
+    else:
+        grouped = {}
+        filename = "announcements_by_day.zip"
+
+    with get_read_pool().acquire() as conn:
+        for row in conn.execute(sql, params):
+            grouped.setdefault(row['bucket'], []).append(row_tuple(row))
+
+    if not any(grouped.values()):
+        return None
+
+    def build_workbook(g_name, g_data):
+        wb = openpyxl.Workbook(write_only=True)
+        create_sheet(wb, g_name, g_data)
+        excel_buffer = BytesIO()
+        wb.save(excel_buffer)
+        return excel_buffer.getvalue()
+
+    groups = [(name, data) for name, data in grouped.items() if data]
+
+    # Small archives stay in RAM, large ones spill to disk instead of
+    # holding the whole zip in memory
+    zip_buffer = tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024)
+    # xlsx entries are themselves deflated zips — re-compressing them
+    # gains ~0% and burns a zlib pass per file, so just store them
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zip_file:
+        if len(groups) > 1:
+            # Per-group workbook builds are independent and spend most of
+            # their time in zlib, which releases the GIL — overlap them on
+            # a small pool. ZipFile is not thread-safe for writes, so the
+            # writestr calls stay here; pool.map keeps archive order.
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(4, len(groups))) as pool:
+                payloads = pool.map(lambda g: build_workbook(*g), groups)
+                for (g_name, _), payload in zip(groups, payloads):
+                    zip_file.writestr(f"{g_name}.xlsx", payload)
+        else:
+            for g_name, g_data in groups:
+                zip_file.writestr(f"{g_name}.xlsx", build_workbook(g_name, g_data))
+
+    zip_buffer.seek(0)
+    return (zip_buffer, "application/zip", filename)
+
+def _announcements_export_state(where_clause, params):
+    """Fingerprint the table state behind an export: row count plus the
+    newest created_at catches inserts and deletes alike."""
+    with get_read_pool().acquire() as conn:
+        row = conn.execute(
+            f"SELECT COUNT(*), MAX(created_at) FROM announcements WHERE {where_clause}",
+            params).fetchone()
+    return f"{row[0]}|{row[1]}"
+
 
 @app.get("/api/announcements/export")
 async def export_announcements(
-    q: str = "", 
-    province: str = "", 
-    export_type: str = "all", 
+    request: Request,
+    q: str = "",
+    province: str = "",
+    export_type: str = "all",
     include_details: str = "false",
     start_date: str = "",
     end_date: str = "",
@@ -404,21 +936,34 @@ async def export_announcements(
 ):
     include_details_bool = include_details.lower() == "true"
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Build WHERE clause
+        # Build WHERE clause. q/province go through the FTS5 trigram
+        # index like the list endpoint; terms under 3 chars (or a legacy
+        # DB without the index) use the LIKE scan instead.
         where_parts = []
         params = []
-        
+
+        fts_terms = [t for t in (q, province) if t]
+        use_fts = bool(fts_terms and all(len(t) >= 3 for t in fts_terms))
+        # instr() beats LIKE for bare substring tests: no pattern
+        # compilation and no %-wrapped bind values
+        like_parts = []
+        like_params = []
         if q:
-            where_parts.append("(title LIKE ? OR content LIKE ?)")
-            params.extend([f"%{q}%", f"%{q}%"])
-        
+            like_parts.append("(instr(title, ?) OR instr(content, ?))")
+            like_params.extend([q, q])
         if province:
-             where_parts.append("(title LIKE ? OR content LIKE ?)")
-             params.extend([f"%{province}%", f"%{province}%"])
-        
+            like_parts.append("(instr(title, ?) OR instr(content, ?))")
+            like_params.extend([province, province])
+
+        if use_fts:
+            match = " AND ".join('"%s"' % t.replace('"', '""') for t in fts_terms)
+            where_parts.append(
+                "id IN (SELECT rowid FROM announcements_fts WHERE announcements_fts MATCH ?)")
+            params.append(match)
+        else:
+            where_parts.extend(like_parts)
+            params.extend(like_params)
+
         # Date Range
         if start_date:
             where_parts.append("publish_date >= ?")
@@ -433,14 +978,14 @@ async def export_announcements(
         # Heuristic Filters (Title/Content matching)
         if pinmu:
              if pinmu == "goods":
-                 where_parts.append("title LIKE ?")
-                 params.append("%货物%")
+                 where_parts.append("instr(title, ?)")
+                 params.append("货物")
              elif pinmu == "engineering":
-                 where_parts.append("title LIKE ?")
-                 params.append("%工程%")
+                 where_parts.append("instr(title, ?)")
+                 params.append("工程")
              elif pinmu == "services":
-                 where_parts.append("title LIKE ?")
-                 params.append("%服务%")
+                 where_parts.append("instr(title, ?)")
+                 params.append("服务")
 
         if category:
             # This is hard because "category" (central/local) depends on source URL or other heuristics not easily mapped to title.
@@ -456,188 +1001,75 @@ async def export_announcements(
         if bid_type:
             # Map types
             if bid_type == "1": # Open Tendering
-                where_parts.append("(title LIKE ? OR title LIKE ?)")
-                params.extend(["%公开招标%", "%招标公告%"])
+                where_parts.append("(instr(title, ?) OR instr(title, ?))")
+                params.extend(["公开招标", "招标公告"])
             elif bid_type == "7": # Winning
-                where_parts.append("(title LIKE ? OR title LIKE ?)")
-                params.extend(["%中标%", "%成交%"])
+                where_parts.append("(instr(title, ?) OR instr(title, ?))")
+                params.extend(["中标", "成交"])
             elif bid_type == "2": # Competitive Negotiation
-                where_parts.append("title LIKE ?")
-                params.append("%谈判%")
+                where_parts.append("instr(title, ?)")
+                params.append("谈判")
             elif bid_type == "3": # Competitive Consultation
-                where_parts.append("title LIKE ?")
-                params.append("%磋商%")
+                where_parts.append("instr(title, ?)")
+                params.append("磋商")
             elif bid_type == "4": # Inquiry
-                 where_parts.append("title LIKE ?")
-                 params.append("%询价%")
+                 where_parts.append("instr(title, ?)")
+                 params.append("询价")
             elif bid_type == "5": # Single Source
-                 where_parts.append("title LIKE ?")
-                 params.append("%单一来源%")
+                 where_parts.append("instr(title, ?)")
+                 params.append("单一来源")
         
         where_clause = " AND ".join(where_parts) if where_parts else "1=1"
-        
-        # Query all matching data
-        sql = f"""
-            SELECT title, url, publish_date, source, content
-            FROM announcements 
-            WHERE {where_clause}
-            ORDER BY publish_date DESC 
-        """
-        cursor.execute(sql, params)
-        rows = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        if not rows:
-             return JSONResponse(status_code=400, content={"error": "No data to export"})
 
         try:
-            import openpyxl
+            import openpyxl  # noqa: F401
         except ImportError:
             return JSONResponse(status_code=500, content={"error": "openpyxl not installed"})
 
-        # Helper to create excel sheet
-        def create_sheet(wb, title, data):
-            ws = wb.create_sheet(title=title[:30]) # Sheet name limit 31 chars
-            # Headers
-            if include_details_bool:
-                 # If including details, HIDE Source and Link (as requested)
-                 headers = ["发布时间", "标题", "详情"]
-            else:
-                 headers = ["发布时间", "标题", "来源", "链接"]
-            
-            ws.append(headers)
-            
-            # Data
-            for item in data:
-                if include_details_bool:
-                    # Limit content length
-                    content = str(item.get('content', ''))
-                    if len(content) > 32000:
-                        content = content[:32000] + "..."
-                    ws.append([
-                        str(item.get('publish_date', '')),
-                        str(item.get('title', '')),
-                        content
-                    ])
-                else:
-                    ws.append([
-                        str(item.get('publish_date', '')),
-                        str(item.get('title', '')),
-                        str(item.get('source', '')),
-                        str(item.get('url', ''))
-                    ])
-
-            # Adjust widths
-            ws.column_dimensions['A'].width = 20
-            ws.column_dimensions['B'].width = 60
-            if include_details_bool:
-                ws.column_dimensions['C'].width = 80
-            else:
-                ws.column_dimensions['C'].width = 25
-                ws.column_dimensions['D'].width = 40
-            
-        
-        if export_type == "all":
-            wb = openpyxl.Workbook()
-            # Remove default sheet
-            if "Sheet" in wb.sheetnames:
-                 del wb["Sheet"]
-            
-            create_sheet(wb, "公告列表", rows)
-            
-            output = BytesIO()
-            wb.save(output)
-            output.seek(0)
-            
-            filename = f"announcements_{export_type}.xlsx"
-            return StreamingResponse(
-                output,
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-            
-        elif export_type == "province":
-            # Group by province
-            provinces = ["北京", "上海", "广东", "江苏", "浙江", "山东", "河南", "四川", "湖北", "湖南", "福建", "安徽", "河北", "陕西", "江西", "重庆", "辽宁", "云南", "广西", "山西", "贵州", "天津", "新疆", "内蒙古", "黑龙江", "吉林", "甘肃", "海南", "宁夏", "青海", "西藏"]
-            
-            grouped = {p: [] for p in provinces}
-            grouped["其他"] = []
-            
-            for item in rows:
-                text = (item.get('title', '') + item.get('content', '')).lower()
-                found = False
-                for p in provinces:
-                    if p in text:
-                        grouped[p].append(item)
-                        found = True
-                        # Don't break if we want to add to multiple? 
-                        # Ideally assign to all matched, but for now specific enough.
-                        # If a record belongs to multiple, it will be added to the first hit if we break.
-                        # Let's not break, add to all matched? No, duplication might be annoying.
-                        # Let's break for simplicity, assuming primary province comes first or is good enough.
-                        break 
-                if not found:
-                    grouped["其他"].append(item)
-            
-            zip_buffer = BytesIO()
-            with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, False) as zip_file:
-                for p_name, p_data in grouped.items():
-                    if not p_data:
-                        continue
-                        
-                    wb = openpyxl.Workbook()
-                    del wb["Sheet"]
-                    create_sheet(wb, p_name, p_data)
-                    
-                    excel_buffer = BytesIO()
-                    wb.save(excel_buffer)
-                    zip_file.writestr(f"{p_name}.xlsx", excel_buffer.getvalue())
-            
-            zip_buffer.seek(0)
-            return StreamingResponse(
-                zip_buffer,
-                media_type="application/zip",
-                headers={"Content-Disposition": "attachment; filename=announcements_by_province.zip"}
-            )
-            
-        elif export_type == "day":
-            # Group by date
-            grouped = {}
-            for item in rows:
-                date_str = item.get('publish_date', '')
-                if not date_str:
-                    date_str = "Unknown"
-                else:
-                    # Try to extract YYYY-MM-DD
-                    try:
-                        date_str = date_str.split(' ')[0] # Handle "2023-01-01 12:00"
-                    except:
-                        pass
-                
-                if date_str not in grouped:
-                    grouped[date_str] = []
-                grouped[date_str].append(item)
-                
-            zip_buffer = BytesIO()
-            with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, False) as zip_file:
-                for d_str, d_data in grouped.items():
-                    wb = openpyxl.Workbook()
-                    del wb["Sheet"]
-                    create_sheet(wb, d_str, d_data)
-                    
-                    excel_buffer = BytesIO()
-                    wb.save(excel_buffer)
-                    zip_file.writestr(f"{d_str}.xlsx", excel_buffer.getvalue())
-
-            zip_buffer.seek(0)
-            return StreamingResponse(
-                zip_buffer,
-                media_type="application/zip",
-                headers={"Content-Disposition": "attachment; filename=announcements_by_day.zip"}
-            )
-            
-        else:
-             return JSONResponse(status_code=400, content={"error": "Invalid export type"})
+        if export_type not in ("all", "province", "day"):
+            return JSONResponse(status_code=400, content={"error": "Invalid export type"})
+
+        # Cheap revalidation before the expensive build: the ETag covers
+        # the filter inputs and the matched rows' state, so an unchanged
+        # repeat download answers 304 without running the export at all.
+        etag = None
+        try:
+            state = await run_db(_announcements_export_state, where_clause, params)
+            etag = '"%s"' % hashlib.blake2b(
+                f"{export_type}|{include_details_bool}|{where_clause}|{params}|{state}".encode(),
+                digest_size=16).hexdigest()
+        except sqlite3.OperationalError:
+            # Legacy DB without the FTS table; the build below falls back
+            # to the LIKE scan, just skip the 304 fast path
+            pass
+        if etag and request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        try:
+            result = await run_db(_build_announcements_export, where_clause, params,
+                                  export_type, include_details_bool)
+        except sqlite3.OperationalError:
+            if not use_fts:
+                raise
+            # Legacy DB without the FTS table: retry with the LIKE scan.
+            rest = where_parts[1:]
+            where_clause = " AND ".join(like_parts + rest) if (like_parts + rest) else "1=1"
+            result = await run_db(_build_announcements_export,
+                                  where_clause, like_params + params[1:],
+                                  export_type, include_details_bool)
+        if result is None:
+            return JSONResponse(status_code=400, content={"error": "No data to export"})
+
+        buffer, media_type, filename = result
+        headers = {"Content-Disposition": f"attachment; filename={filename}"}
+        if etag:
+            headers["ETag"] = etag
+            headers["Cache-Control"] = "no-cache"
+        return StreamingResponse(
+            _iter_and_close(buffer),
+            media_type=media_type,
+            headers=headers
+        )
 
     except Exception as e:
         import traceback
@@ -645,178 +1077,228 @@ async def export_announcements(
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+def _query_announcement_detail(item_id: int):
+    with get_read_pool().acquire() as conn:
+        row = conn.execute(
+            "SELECT * FROM announcements WHERE id = ?", (item_id,)
+        ).fetchone()
+    return dict(row) if row else None
+
 @app.get("/api/announcements/{item_id}")
 async def get_announcement_detail(item_id: int):
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM announcements WHERE id = ?", (item_id,))
-        row = cursor.fetchone()
+        row = await run_db(_query_announcement_detail, item_id)
         if not row:
             return JSONResponse(status_code=404, content={"error": "Not found"})
-        return dict(row)
+        return row
     except Exception as e:
         return {"error": str(e)}
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
-@app.get("/api/cards")
-async def get_cards(limit: int = 50, offset: int = 0, q: str = "", role: str = "", province: str = ""):
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # 构建查询条件
-        where_parts = []
+# SQL text cache for the paginated cards query — same idea as
+# _ANN_SQL_CACHE: only 8 filter shapes exist, so the compiled statement
+# is reused across requests instead of re-prepared
+_CARDS_SQL_CACHE = {}
+
+def _cards_sql(has_q: bool, has_role: bool, has_province: bool):
+    key = (has_q, has_role, has_province)
+    cached = _CARDS_SQL_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # 构建查询条件
+    where_parts = []
+    extra_joins = ""
+
+    # projects_count is maintained on business_cards by triggers, so the
+    # mentions table is only joined when a role/province filter needs it
+    need_inner_join = has_role or has_province
+    bcm_join = "INNER JOIN business_card_mentions bcm ON bcm.business_card_id = bc.id" if need_inner_join else ""
+
+    # With a mention-level filter active the count must reflect only the
+    # mentions that matched the filter (the joined rows), not the card's
+    # trigger-maintained total; the precomputed column only serves the
+    # unfiltered shapes where the mentions join is skipped entirely
+    projects_expr = (
+        "COUNT(DISTINCT bcm.announcement_id)" if need_inner_join
+        else "MAX(bc.projects_count)")
+
+    # 文本搜索条件
+    if has_q:
+        where_parts.append("(bc.company LIKE ? OR bc.contact_name LIKE ?)")
+
+    # 角色筛选条件
+    if has_role:
+        where_parts.append("bcm.role = ?")
+
+    # 省份筛选条件（通过关联的公告内容匹配）
+    if has_province:
+        extra_joins = "JOIN announcements a ON bcm.announcement_id = a.id"
+        where_parts.append("(a.title LIKE ? OR a.content LIKE ?)")
+
+    where_clause = "WHERE " + " AND ".join(where_parts) if where_parts else ""
+
+    # 获取分页数据 (Deduplicated)
+    # We group by company+contact and aggregate project counts.
+    # We pick the MAX(id) to represent the group for clicking.
+    # COUNT(*) OVER () runs after grouping but before LIMIT, so the
+    # deduplicated total arrives in the same round-trip as the page.
+    # phones/emails are flattened from their JSON arrays by SQLite
+    # (json_each + group_concat) so Python never re-parses them per row.
+    data_sql = f"""
+        SELECT t.*,
+            COALESCE((SELECT group_concat(value, ', ') FROM json_each(t.phones_json)), '') AS phones,
+            COALESCE((SELECT group_concat(value, ', ') FROM json_each(t.emails_json)), '') AS emails
+        FROM (
+            SELECT
+                MAX(bc.id) as id,
+                bc.company,
+                bc.contact_name,
+                MAX(bc.phones_json) as phones_json,
+                MAX(bc.emails_json) as emails_json,
+                MAX(bc.created_at) as created_at,
+                MAX(bc.updated_at) as updated_at,
+                {projects_expr} AS projects_count,
+                COUNT(*) OVER () AS _total
+            FROM business_cards bc
+            {bcm_join}
+            {extra_joins}
+            {where_clause}
+            GROUP BY bc.company, bc.contact_name
+            ORDER BY updated_at DESC
+            LIMIT ? OFFSET ?
+        ) t
+        ORDER BY t.updated_at DESC
+    """
+
+    count_sql = f"""
+        SELECT COUNT(*) FROM (
+            SELECT 1
+            FROM business_cards bc
+            {bcm_join}
+            {extra_joins}
+            {where_clause}
+            GROUP BY bc.company, bc.contact_name
+        )
+    """
+
+    _CARDS_SQL_CACHE[key] = (data_sql, count_sql)
+    return data_sql, count_sql
+
+def _query_cards(limit: int, offset: int, q: str, role: str, province: str):
         params = []
-        extra_joins = ""
-        
-        # 决定使用 INNER JOIN 还是 LEFT JOIN（如有筛选条件则必须 INNER JOIN）
-        need_inner_join = bool(role or province)
-        bcm_join = "INNER JOIN business_card_mentions bcm ON bcm.business_card_id = bc.id" if need_inner_join else "LEFT JOIN business_card_mentions bcm ON bcm.business_card_id = bc.id"
-        
-        # 文本搜索条件
         if q:
             search = f"%{q}%"
-            where_parts.append("(bc.company LIKE ? OR bc.contact_name LIKE ?)")
             params.extend([search, search])
-        
-        # 角色筛选条件
         if role:
-            where_parts.append("bcm.role = ?")
             params.append(role)
-        
-        # 省份筛选条件（通过关联的公告内容匹配）
         if province:
-            extra_joins = "JOIN announcements a ON bcm.announcement_id = a.id"
-            where_parts.append("(a.title LIKE ? OR a.content LIKE ?)")
             params.extend([f"%{province}%", f"%{province}%"])
-        
-        where_clause = "WHERE " + " AND ".join(where_parts) if where_parts else ""
-        
+
+        data_sql, count_sql = _cards_sql(bool(q), bool(role), bool(province))
+
         # 调试日志
         print(f"[DEBUG Cards API] role={role}, province={province}")
-        print(f"[DEBUG Cards API] bcm_join={bcm_join}")
-        print(f"[DEBUG Cards API] where_clause={where_clause}")
         print(f"[DEBUG Cards API] params={params}")
-        
-        # 获取总数 (Deduplicated count)
-        count_sql = f"""
-            SELECT COUNT(*) FROM (
-                SELECT 1 
-                FROM business_cards bc
-                {bcm_join}
-                {extra_joins}
-                {where_clause}
-                GROUP BY bc.company, bc.contact_name
-            )
-        """
-        cursor.execute(count_sql, params)
-        total_row = cursor.fetchone()
-        total = total_row[0] if total_row else 0
-        
-        # 获取分页数据 (Deduplicated)
-        # We group by company+contact and aggregate project counts.
-        # We pick the MAX(id) to represent the group for clicking.
-        data_sql = f"""
-            SELECT 
-                MAX(bc.id) as id, 
-                bc.company, 
-                bc.contact_name, 
-                MAX(bc.phones_json) as phones_json, 
-                MAX(bc.emails_json) as emails_json,
-                MAX(bc.created_at) as created_at, 
-                MAX(bc.updated_at) as updated_at,
-                COUNT(DISTINCT bcm.announcement_id) AS projects_count
-            FROM business_cards bc
-            {bcm_join}
-            {extra_joins}
-            {where_clause}
-            GROUP BY bc.company, bc.contact_name
-            ORDER BY updated_at DESC 
-            LIMIT ? OFFSET ?
-        """
-        cursor.execute(data_sql, params + [limit, offset])
-        
-        import json
-        results = []
-        for row in cursor.fetchall():
-            card = dict(row)
-            # Parse JSON fields
-            try:
-                phones_list = json.loads(card.get('phones_json') or '[]')
-                card['phones'] = ', '.join(phones_list) if phones_list else ''
-            except:
-                card['phones'] = ''
-            try:
-                emails_list = json.loads(card.get('emails_json') or '[]')
-                card['emails'] = ', '.join(emails_list) if emails_list else ''
-            except:
-                card['emails'] = ''
-            results.append(card)
-        
+
+        with get_read_pool().acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute(data_sql, params + [limit, offset])
+            rows = cursor.fetchall()
+
+            if rows:
+                total = rows[0]["_total"]
+            elif offset > 0:
+                # Page past the end — count the groups separately
+                cursor.execute(count_sql, params)
+                total_row = cursor.fetchone()
+                total = total_row[0] if total_row else 0
+            else:
+                total = 0
+
+        # phones/emails already flattened server-side — no per-row
+        # json.loads. Map rows with a prebound itemgetter + zip instead
+        # of dict(row)/del per row: everything per-row runs in C.
+        if rows:
+            cols = rows[0].keys()
+            idxs = [i for i, c in enumerate(cols) if c != '_total']
+            names = [cols[i] for i in idxs]
+            getter = operator.itemgetter(*idxs)
+            results = [dict(zip(names, getter(r))) for r in rows]
+        else:
+            results = []
+
         return {
             "total": total,
             "limit": limit,
             "offset": offset,
             "items": results
         }
+
+@app.get("/api/cards")
+async def get_cards(limit: int = 50, offset: int = 0, q: str = "", role: str = "", province: str = ""):
+    try:
+        return await run_db(_query_cards, limit, offset, q, role, province)
     except Exception as e:
         return {"error": str(e)}
-    finally:
-        if 'conn' in locals():
-            conn.close()
+
+def _query_card_mentions(card_id: int):
+        with get_read_pool().acquire() as conn:
+            cursor = conn.cursor()
+
+            # First, find the company and contact_name for this card_id
+            cursor.execute("SELECT company, contact_name FROM business_cards WHERE id = ?", (card_id,))
+            card_info = cursor.fetchone()
+
+            if not card_info:
+                return []
+
+            company, contact_name = card_info['company'], card_info['contact_name']
+
+            # Now fetch mentions for ALL cards that match this company and contact_name
+            # This aggregates history from "duplicate" entries
+            cursor.execute("""
+                SELECT
+                    a.id, a.title, a.url, a.source, a.publish_date,
+                    bcm.role
+                FROM business_card_mentions bcm
+                JOIN business_cards bc ON bcm.business_card_id = bc.id
+                JOIN announcements a ON bcm.announcement_id = a.id
+                WHERE bc.company = ? AND bc.contact_name = ?
+                ORDER BY a.publish_date DESC
+            """, (company, contact_name))
+
+            return list(_rows_as_dicts(cursor))
 
 @app.get("/api/cards/{card_id}/mentions")
 async def get_card_mentions(card_id: int):
     try:
-        conn = get_db_connection()
-        # We need to use the Database class method, but here we are using raw connection in get_db_connection helper.
-        # However, the previous code in server.py mainly uses raw sql. 
-        # But wait, `Database()` in `lifespan` just inits the table.
-        # The `get_db_connection` returns a raw sqlite3 connection.
-        # It's better to use the `Database` class if possible, or just write the SQL here.
-        # Since I just added the SQL to Database class, I should probably use it or copy the SQL.
-        # `server.py` seems to use `get_db_connection` and raw SQL for other endpoints.
-        # To match the style (and avoid instantiating Database class which might have overhead or different locking),
-        # I will replicate the SQL here as commonly done in this file.
-        
-        cursor = conn.cursor()
-        
-        # First, find the company and contact_name for this card_id
-        cursor.execute("SELECT company, contact_name FROM business_cards WHERE id = ?", (card_id,))
-        card_info = cursor.fetchone()
-        
-        if not card_info:
-            return []
-            
-        company, contact_name = card_info['company'], card_info['contact_name']
-        
-        # Now fetch mentions for ALL cards that match this company and contact_name
-        # This aggregates history from "duplicate" entries
-        cursor.execute("""
-            SELECT 
-                a.id, a.title, a.url, a.source, a.publish_date, 
-                bcm.role
-            FROM business_card_mentions bcm
-            JOIN business_cards bc ON bcm.business_card_id = bc.id
-            JOIN announcements a ON bcm.announcement_id = a.id
-            WHERE bc.company = ? AND bc.contact_name = ?
-            ORDER BY a.publish_date DESC
-        """, (company, contact_name))
-        
-        return [dict(row) for row in cursor.fetchall()]
+        return await run_db(_query_card_mentions, card_id)
     except Exception as e:
         return {"error": str(e)}
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 # ========== Keyword Management ==========
 KEYWORDS_FILE = os.path.join("data", "saved_keywords.json")
 
+def _load_json_file(path: str):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    import json
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _dump_json_file(path: str, data):
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    import json
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
 class KeywordsRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, extra='ignore', frozen=True)
+
     keywords: List[str]
     filename: Optional[str] = None
 
@@ -824,10 +1306,7 @@ class KeywordsRequest(BaseModel):
 async def get_keywords():
     try:
         if os.path.exists(KEYWORDS_FILE):
-            import json
-            with open(KEYWORDS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data
+            return _load_json_file(KEYWORDS_FILE)
         return {"keywords": [], "filename": None}
     except Exception as e:
         return {"error": str(e)}
@@ -835,142 +1314,192 @@ async def get_keywords():
 @app.post("/api/keywords")
 async def save_keywords(req: KeywordsRequest):
     try:
-        import json
         # Ensure data directory exists
         os.makedirs(os.path.dirname(KEYWORDS_FILE), exist_ok=True)
-        
+
         data = {
             "keywords": req.keywords,
             "filename": req.filename
         }
-        with open(KEYWORDS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
+        _dump_json_file(KEYWORDS_FILE, data)
+
         return {"status": "saved", "count": len(req.keywords)}
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 # ========== Card Export ==========
-@app.get("/api/cards/export")
-async def export_cards(q: str = ""):
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
+# phones/emails are flattened from their JSON arrays by SQLite
+# (json_each + group_concat), so no per-row json.loads downstream.
+# projects_count is trigger-maintained on the table — no join, no
+# GROUP BY: the export is one ordered scan of business_cards. Both
+# variants are finalized at import so every request reuses the exact
+# SQL text and hits the connection's statement cache.
+_CARDS_EXPORT_SQL = """
+    SELECT
+        bc.company, bc.contact_name,
+        COALESCE((SELECT group_concat(value, ', ') FROM json_each(bc.phones_json)), '') AS phones,
+        COALESCE((SELECT group_concat(value, ', ') FROM json_each(bc.emails_json)), '') AS emails,
+        bc.projects_count,
+        bc.created_at, bc.updated_at
+    FROM business_cards bc
+    {where}
+    ORDER BY bc.company, bc.contact_name
+"""
+_CARDS_EXPORT_ALL = _CARDS_EXPORT_SQL.format(where="")
+_CARDS_EXPORT_SEARCH = _CARDS_EXPORT_SQL.format(
+    where="WHERE bc.company LIKE ? OR bc.contact_name LIKE ?")
+
+# Finished card exports are cached on disk keyed by query + table state,
+# so repeated downloads of an unchanged card list don't rebuild the
+# workbook. Entries are evicted least-recently-used past the size cap.
+_CARDS_CACHE_DIR = os.path.join(str(EXPORT_DIR), ".xlsx_cache")
+_CARDS_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+def _cards_cache_key(q: str) -> str:
+    """Fingerprint the export inputs: the query string plus table state.
+
+    Any insert or update bumps MAX(updated_at); COUNT(*) catches
+    deletes, which would leave the max unchanged.
+    """
+    with get_read_pool().acquire() as conn:
         if q:
             search = f"%{q}%"
-            cursor.execute("""
-                SELECT 
-                    bc.id, bc.company, bc.contact_name, 
-                    bc.phones_json, bc.emails_json,
-                    bc.created_at, bc.updated_at,
-                    COUNT(DISTINCT bcm.announcement_id) AS projects_count
-                FROM business_cards bc
-                LEFT JOIN business_card_mentions bcm ON bcm.business_card_id = bc.id
-                WHERE bc.company LIKE ? OR bc.contact_name LIKE ?
-                GROUP BY bc.id
-                ORDER BY bc.company, bc.contact_name
-            """, (search, search))
+            row = conn.execute(
+                "SELECT COUNT(*), MAX(updated_at) FROM business_cards"
+                " WHERE company LIKE ? OR contact_name LIKE ?",
+                (search, search)).fetchone()
         else:
-            cursor.execute("""
-                SELECT 
-                    bc.id, bc.company, bc.contact_name, 
-                    bc.phones_json, bc.emails_json,
-                    bc.created_at, bc.updated_at,
-                    COUNT(DISTINCT bcm.announcement_id) AS projects_count
-                FROM business_cards bc
-                LEFT JOIN business_card_mentions bcm ON bcm.business_card_id = bc.id
-                GROUP BY bc.id
-                ORDER BY bc.company, bc.contact_name
-            """)
-        
-        import json
-        rows = []
-        for row in cursor.fetchall():
-            card = dict(row)
-            try:
-                phones = json.loads(card.get('phones_json') or '[]')
-                card['phones'] = ', '.join(phones)
-            except:
-                card['phones'] = ''
-            try:
-                emails = json.loads(card.get('emails_json') or '[]')
-                card['emails'] = ', '.join(emails)
-            except:
-                card['emails'] = ''
-            rows.append(card)
-        
-        conn.close()
-        
-        # Generate Excel file
-        try:
-            import openpyxl
-            from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-        except ImportError:
-            return JSONResponse(status_code=500, content={"error": "openpyxl not installed. Run: pip install openpyxl"})
-        
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "名片库"
-        
+            row = conn.execute(
+                "SELECT COUNT(*), MAX(updated_at) FROM business_cards"
+            ).fetchone()
+    return hashlib.blake2b(
+        f"{q}|{row[0]}|{row[1]}".encode(), digest_size=16).hexdigest()
+
+def _evict_cards_cache() -> None:
+    """Delete oldest cache entries until the cache fits the budget."""
+    try:
+        entries = []
+        with os.scandir(_CARDS_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _mtime, size, path in entries:
+            if total <= _CARDS_CACHE_MAX_BYTES:
+                break
+            os.unlink(path)
+            total -= size
+    except OSError:
+        # Cache housekeeping is best-effort; never fail the export
+        pass
+
+def _export_cards_xlsx(q: str) -> str:
+        """Stream the card export into a temp .xlsx and return its path.
+
+        Uses openpyxl's write-only mode and iterates the DB cursor
+        directly, so peak memory stays flat regardless of how many cards
+        are exported.
+        """
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, Alignment, PatternFill
+        from openpyxl.utils import get_column_letter
+
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("名片库")
+
+        # Column widths must be declared before rows in write-only mode
+        for col, width in enumerate((40, 15, 20, 30, 12, 20, 20), 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+
         # Header style
         header_font = Font(bold=True, color="FFFFFF")
         header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
         header_alignment = Alignment(horizontal="center", vertical="center")
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Headers
+
         headers = ["公司名称", "联系人", "电话", "邮箱", "关联项目数", "创建时间", "更新时间"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
             cell.font = header_font
             cell.fill = header_fill
             cell.alignment = header_alignment
-            cell.border = thin_border
-        
-        # Data rows
-        for row_idx, card in enumerate(rows, 2):
-            ws.cell(row=row_idx, column=1, value=card.get('company', ''))
-            ws.cell(row=row_idx, column=2, value=card.get('contact_name', ''))
-            ws.cell(row=row_idx, column=3, value=card.get('phones', ''))
-            ws.cell(row=row_idx, column=4, value=card.get('emails', ''))
-            ws.cell(row=row_idx, column=5, value=card.get('projects_count', 0))
-            ws.cell(row=row_idx, column=6, value=card.get('created_at', ''))
-            ws.cell(row=row_idx, column=7, value=card.get('updated_at', ''))
-            
-            for col in range(1, 8):
-                ws.cell(row=row_idx, column=col).border = thin_border
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 40
-        ws.column_dimensions['B'].width = 15
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 30
-        ws.column_dimensions['E'].width = 12
-        ws.column_dimensions['F'].width = 20
-        ws.column_dimensions['G'].width = 20
-        
-        # Save to bytes
-        from io import BytesIO
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
+            header_row.append(cell)
+        ws.append(header_row)
+
+        with get_read_pool().acquire() as conn:
+            cursor = conn.cursor()
+
+            # Explicit read transaction: the whole export sees one WAL
+            # snapshot, and COMMIT right after the cursor is exhausted
+            # releases the read mark so checkpoints aren't held up for
+            # the duration of the workbook save
+            cursor.execute("BEGIN")
+            try:
+                if q:
+                    search = f"%{q}%"
+                    cursor.execute(_CARDS_EXPORT_SEARCH, (search, search))
+                else:
+                    cursor.execute(_CARDS_EXPORT_ALL)
+
+                # Stream rows cursor -> worksheet, no fetchall. The SELECT
+                # column order matches the sheet columns, so each row goes
+                # straight in as a tuple without per-field name lookups.
+                for row in cursor:
+                    ws.append(tuple(row))
+            finally:
+                cursor.execute("COMMIT")
+
+        fd, tmp_path = tempfile.mkstemp(suffix=".xlsx", dir=str(EXPORT_DIR))
+        os.close(fd)
+        wb.save(tmp_path)
+        return tmp_path
+
+@app.get("/api/cards/export")
+async def export_cards(request: Request, q: str = ""):
+    try:
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            return JSONResponse(status_code=500, content={"error": "openpyxl not installed. Run: pip install openpyxl"})
+
+        key = await run_db(_cards_cache_key, q)
+        cache_path = os.path.join(_CARDS_CACHE_DIR, f"{key}.xlsx")
+
+        # The cache key already fingerprints query + table state, so it
+        # doubles as the ETag: a revalidating client skips even the
+        # cache-file read when nothing changed.
+        etag = '"%s"' % key
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        if os.path.exists(cache_path):
+            # Cache hit: touch the mtime so eviction keeps hot entries
+            os.utime(cache_path)
+        else:
+            tmp_path = await run_db(_export_cards_xlsx, q)
+            os.makedirs(_CARDS_CACHE_DIR, exist_ok=True)
+            # Atomic publish: concurrent builders race harmlessly, the
+            # last rename wins and no reader ever sees a partial file
+            os.replace(tmp_path, cache_path)
+            _evict_cards_cache()
+
         from datetime import datetime
         filename = f"business_cards_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        
-        from fastapi.responses import StreamingResponse
-        return StreamingResponse(
-            output,
+
+        # The cached file is served in place — no per-request unlink
+        return FileResponse(
+            cache_path,
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}",
+                "ETag": etag,
+                "Cache-Control": "no-cache",
+            },
         )
-        
+
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -1041,7 +1570,22 @@ if __name__ == "__main__":
             threading.Thread(target=open_browser, daemon=True).start()
                 
             print("Starting server on http://localhost:8080")
-            uvicorn.run(app, host="0.0.0.0", port=8080, log_level="info")
+            # Prefer the native event loop / HTTP parser when installed
+            # (uvloop is POSIX-only; "auto" keeps the Windows build on
+            # asyncio). Single worker: ProcessManager and the log
+            # websocket live in this process.
+            try:
+                import uvloop  # noqa: F401
+                loop_impl = "uvloop"
+            except ImportError:
+                loop_impl = "auto"
+            try:
+                import httptools  # noqa: F401
+                http_impl = "httptools"
+            except ImportError:
+                http_impl = "auto"
+            uvicorn.run(app, host="0.0.0.0", port=8080, log_level="info",
+                        loop=loop_impl, http=http_impl)
             
     except Exception as e:
         import traceback
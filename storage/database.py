@@ -5,18 +5,123 @@
 import json
 import logging
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from config.settings import DB_PATH
 
+# orjson（可选）：联系方式JSON的解析/序列化比标准库快数倍，
+# 每张名片的upsert和每次查询都会走这条路径；未安装时回退标准库
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(s):
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        # orjson输出UTF-8字节串，语义上等同ensure_ascii=False
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
 class Database:
     """数据库操作类"""
 
+    # UPSERT + RETURNING（名片合并写入的单语句路径）
+    _HAS_UPSERT_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+    # 无条件的建表/建索引DDL，一次executescript执行完，省去逐条
+    # execute的往返。有条件的部分（FTS、列迁移、回填）仍在
+    # _init_db里按Python逻辑处理
+    _SCHEMA_DDL = '''
+        -- 公告表
+        CREATE TABLE IF NOT EXISTS announcements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            url TEXT UNIQUE NOT NULL,
+            content TEXT,
+            publish_date TEXT,
+            source TEXT,
+            scraped_at TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        -- 联系人表
+        CREATE TABLE IF NOT EXISTS contacts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            announcement_id INTEGER,
+            company TEXT,
+            contact_name TEXT,
+            phone TEXT,
+            email TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (announcement_id) REFERENCES announcements (id)
+        );
+
+        -- 聚合名片表（按 company + contact_name 合并联系方式）
+        CREATE TABLE IF NOT EXISTS business_cards (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company TEXT NOT NULL,
+            contact_name TEXT NOT NULL,
+            phones_json TEXT NOT NULL DEFAULT '[]',
+            emails_json TEXT NOT NULL DEFAULT '[]',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(company, contact_name)
+        );
+
+        -- 名片与公告的关联（用于统计“出现于多少项目/公告”）
+        CREATE TABLE IF NOT EXISTS business_card_mentions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            business_card_id INTEGER NOT NULL,
+            announcement_id INTEGER NOT NULL,
+            role TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(business_card_id, announcement_id, role),
+            FOREIGN KEY (business_card_id) REFERENCES business_cards (id),
+            FOREIGN KEY (announcement_id) REFERENCES announcements (id)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_announcements_url
+        ON announcements (url);
+
+        CREATE INDEX IF NOT EXISTS idx_announcements_source
+        ON announcements (source);
+
+        CREATE INDEX IF NOT EXISTS idx_contacts_company
+        ON contacts (company);
+
+        CREATE INDEX IF NOT EXISTS idx_business_cards_company
+        ON business_cards (company);
+
+        CREATE INDEX IF NOT EXISTS idx_business_cards_company_contact
+        ON business_cards (company, contact_name);
+
+        -- 覆盖索引：公告列表按publish_date倒序分页，索引内即可取出
+        -- 列表页需要的全部列，无需回表
+        CREATE INDEX IF NOT EXISTS idx_announcements_pub_date_cover
+        ON announcements (publish_date DESC, id, title, url, source);
+
+        -- 名片关联查询/统计都按business_card_id连接
+        CREATE INDEX IF NOT EXISTS idx_bcm_card_announcement
+        ON business_card_mentions (business_card_id, announcement_id);
+
+        -- 反向按公告查名片提及（与上面的复合索引互补）
+        CREATE INDEX IF NOT EXISTS idx_bcm_announcement
+        ON business_card_mentions (announcement_id);
+    '''
+
     def __init__(self, db_path: str = None):
         """
         初始化数据库
@@ -26,6 +131,7 @@ class Database:
         """
         self.db_path = db_path or DB_PATH
         self.conn: Optional[sqlite3.Connection] = None
+        self._in_bulk = False
         self._init_db()
 
     def _init_db(self):
@@ -35,96 +141,184 @@ class Database:
 
         self.connect()
 
-        # 创建公告表
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS announcements (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                url TEXT UNIQUE NOT NULL,
-                content TEXT,
-                publish_date TEXT,
-                source TEXT,
-                scraped_at TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        # 基础表结构与索引一次性建完
+        self.conn.executescript(self._SCHEMA_DDL)
 
-        # 创建联系人表
-        self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS contacts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                announcement_id INTEGER,
-                company TEXT,
-                contact_name TEXT,
-                phone TEXT,
-                email TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (announcement_id) REFERENCES announcements (id)
-            )
-        ''')
+        # 公告全文索引（外部内容表，由触发器与announcements保持同步）
+        # trigram分词器支持中文子串匹配；旧版SQLite不支持FTS5/trigram时
+        # 静默跳过，查询侧会回退为LIKE扫描
+        try:
+            self.conn.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS announcements_fts
+                USING fts5(
+                    title, content,
+                    content='announcements', content_rowid='id',
+                    tokenize='trigram'
+                )
+            ''')
+            self.conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS announcements_ai
+                AFTER INSERT ON announcements BEGIN
+                    INSERT INTO announcements_fts (rowid, title, content)
+                    VALUES (new.id, new.title, new.content);
+                END
+            ''')
+            self.conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS announcements_ad
+                AFTER DELETE ON announcements BEGIN
+                    INSERT INTO announcements_fts (announcements_fts, rowid, title, content)
+                    VALUES ('delete', old.id, old.title, old.content);
+                END
+            ''')
+            self.conn.execute('''
+                CREATE TRIGGER IF NOT EXISTS announcements_au
+                AFTER UPDATE ON announcements BEGIN
+                    INSERT INTO announcements_fts (announcements_fts, rowid, title, content)
+                    VALUES ('delete', old.id, old.title, old.content);
+                    INSERT INTO announcements_fts (rowid, title, content)
+                    VALUES (new.id, new.title, new.content);
+                END
+            ''')
+
+            # 老库升级：触发器建立前已有的公告需要补建索引
+            fts_rows = self.conn.execute(
+                'SELECT COUNT(*) FROM announcements_fts'
+            ).fetchone()[0]
+            if fts_rows == 0:
+                total = self.conn.execute(
+                    'SELECT COUNT(*) FROM announcements'
+                ).fetchone()[0]
+                if total > 0:
+                    self.conn.execute(
+                        "INSERT INTO announcements_fts (announcements_fts) VALUES ('rebuild')"
+                    )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5全文索引不可用，检索回退为LIKE: {e}")
+
+        # 反范式化：projects_count由触发器维护，查询名片时不再
+        # JOIN + GROUP BY关联表（去重按announcement_id：同一公告
+        # 多个角色只算一个项目）
+        bc_columns = {
+            row[1] for row in self.conn.execute('PRAGMA table_info(business_cards)')
+        }
+        if 'projects_count' not in bc_columns:
+            self.conn.execute('''
+                ALTER TABLE business_cards
+                ADD COLUMN projects_count INTEGER NOT NULL DEFAULT 0
+            ''')
+            self.conn.execute('''
+                UPDATE business_cards
+                SET projects_count = (
+                    SELECT COUNT(DISTINCT announcement_id)
+                    FROM business_card_mentions
+                    WHERE business_card_id = business_cards.id
+                )
+            ''')
 
-        # 聚合名片表（按 company + contact_name 合并联系方式）
         self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS business_cards (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                company TEXT NOT NULL,
-                contact_name TEXT NOT NULL,
-                phones_json TEXT NOT NULL DEFAULT '[]',
-                emails_json TEXT NOT NULL DEFAULT '[]',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(company, contact_name)
-            )
+            CREATE TRIGGER IF NOT EXISTS bcm_ai
+            AFTER INSERT ON business_card_mentions BEGIN
+                UPDATE business_cards
+                SET projects_count = projects_count + 1
+                WHERE id = NEW.business_card_id
+                  AND NOT EXISTS (
+                      SELECT 1 FROM business_card_mentions
+                      WHERE business_card_id = NEW.business_card_id
+                        AND announcement_id = NEW.announcement_id
+                        AND id != NEW.id
+                  );
+            END
         ''')
 
-        # 名片与公告的关联（用于统计“出现于多少项目/公告”）
         self.conn.execute('''
-            CREATE TABLE IF NOT EXISTS business_card_mentions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                business_card_id INTEGER NOT NULL,
-                announcement_id INTEGER NOT NULL,
-                role TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(business_card_id, announcement_id, role),
-                FOREIGN KEY (business_card_id) REFERENCES business_cards (id),
-                FOREIGN KEY (announcement_id) REFERENCES announcements (id)
-            )
+            CREATE TRIGGER IF NOT EXISTS bcm_ad
+            AFTER DELETE ON business_card_mentions BEGIN
+                UPDATE business_cards
+                SET projects_count = projects_count - 1
+                WHERE id = OLD.business_card_id
+                  AND NOT EXISTS (
+                      SELECT 1 FROM business_card_mentions
+                      WHERE business_card_id = OLD.business_card_id
+                        AND announcement_id = OLD.announcement_id
+                  );
+            END
         ''')
 
-        # 创建索引
+        # 公司计数汇总表：触发器随contacts增删维护，统计热门公司时
+        # 只扫这张小表，不再对contacts全表GROUP BY
         self.conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_announcements_url
-            ON announcements (url)
+            CREATE TABLE IF NOT EXISTS company_counts (
+                company TEXT PRIMARY KEY,
+                cnt INTEGER NOT NULL DEFAULT 0
+            )
         ''')
 
         self.conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_announcements_source
-            ON announcements (source)
+            CREATE TRIGGER IF NOT EXISTS contacts_ai
+            AFTER INSERT ON contacts
+            WHEN NEW.company IS NOT NULL AND NEW.company != ''
+            BEGIN
+                INSERT INTO company_counts (company, cnt)
+                VALUES (NEW.company, 1)
+                ON CONFLICT(company) DO UPDATE SET cnt = cnt + 1;
+            END
         ''')
 
         self.conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_contacts_company
-            ON contacts (company)
+            CREATE TRIGGER IF NOT EXISTS contacts_ad
+            AFTER DELETE ON contacts
+            WHEN OLD.company IS NOT NULL AND OLD.company != ''
+            BEGIN
+                UPDATE company_counts SET cnt = cnt - 1
+                WHERE company = OLD.company;
+            END
         ''')
 
-        self.conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_business_cards_company
-            ON business_cards (company)
-        ''')
+        # 老库升级：触发器建立前已有的联系人需要补算
+        cc_rows = self.conn.execute(
+            'SELECT COUNT(*) FROM company_counts'
+        ).fetchone()[0]
+        if cc_rows == 0:
+            self.conn.execute('''
+                INSERT INTO company_counts (company, cnt)
+                SELECT company, COUNT(*)
+                FROM contacts
+                WHERE company IS NOT NULL AND company != ''
+                GROUP BY company
+            ''')
 
+        # 导出覆盖索引：按company, contact_name排序导出全表时直接
+        # 顺序扫索引，不回表。代价是本表存储约翻倍。
+        # 必须建在projects_count列迁移之后
         self.conn.execute('''
-            CREATE INDEX IF NOT EXISTS idx_business_cards_company_contact
-            ON business_cards (company, contact_name)
+            CREATE INDEX IF NOT EXISTS idx_bc_export_cover
+            ON business_cards (company, contact_name, phones_json,
+                               emails_json, projects_count,
+                               created_at, updated_at)
         ''')
 
         self.conn.commit()
         logger.info(f"数据库初始化完成: {self.db_path}")
 
+    # 连接级调优：WAL让server端的只读连接与抓取写入互不阻塞，
+    # synchronous=NORMAL把每次commit的fsync降为WAL追加（WAL下依然安全），
+    # 其余减少临时文件与页缓存miss
+    _PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA temp_store=MEMORY',
+        'PRAGMA cache_size=-64000',
+        'PRAGMA mmap_size=268435456',
+        'PRAGMA busy_timeout=30000',
+    )
+
     def connect(self):
         """连接数据库"""
         if not self.conn:
             self.conn = sqlite3.connect(str(self.db_path))
             self.conn.row_factory = sqlite3.Row
+            for pragma in self._PRAGMAS:
+                self.conn.execute(pragma)
 
     def close(self):
         """关闭数据库连接"""
@@ -132,6 +326,30 @@ class Database:
             self.conn.close()
             self.conn = None
 
+    def _commit(self):
+        """提交写入；批量模式下推迟到bulk()结束统一提交"""
+        if not self._in_bulk:
+            self.conn.commit()
+
+    @contextmanager
+    def bulk(self):
+        """
+        批量写入上下文：块内的所有写操作合并为一个事务
+
+        抓取时每条公告会触发一次插入加若干次名片写入，逐条commit
+        意味着逐条fsync；包在bulk()里后整块只提交一次。
+        """
+        self.connect()
+        self._in_bulk = True
+        try:
+            yield self
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_bulk = False
+
     def get_announcement_id_by_url(self, url: str) -> Optional[int]:
         """按URL查询公告ID（用于跨多次搜索的去重）"""
         if not url:
@@ -173,7 +391,7 @@ class Database:
                 announcement.get('scraped_at'),
             ))
 
-            self.conn.commit()
+            self._commit()
 
             if cursor.rowcount > 0:
                 announcement_id = cursor.lastrowid
@@ -210,6 +428,44 @@ class Database:
         try:
             self.connect()
 
+            # 单条UPSERT：冲突时由json_each/json_group_array在SQL里
+            # 合并去重联系方式，一次往返替代查-改-写三步。
+            # RETURNING需要SQLite>=3.35，旧版本回退老路径
+            if self._HAS_UPSERT_RETURNING:
+                row = self.conn.execute(
+                    '''
+                    INSERT INTO business_cards (company, contact_name, phones_json, emails_json)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(company, contact_name) DO UPDATE SET
+                        phones_json = (
+                            SELECT json_group_array(value) FROM (
+                                SELECT value FROM json_each(business_cards.phones_json)
+                                UNION
+                                SELECT value FROM json_each(excluded.phones_json)
+                                ORDER BY value
+                            )
+                        ),
+                        emails_json = (
+                            SELECT json_group_array(value) FROM (
+                                SELECT value FROM json_each(business_cards.emails_json)
+                                UNION
+                                SELECT value FROM json_each(excluded.emails_json)
+                                ORDER BY value
+                            )
+                        ),
+                        updated_at = CURRENT_TIMESTAMP
+                    RETURNING id
+                    ''',
+                    (
+                        company,
+                        contact_name,
+                        _json_dumps(sorted(phones_set)),
+                        _json_dumps(sorted(emails_set)),
+                    ),
+                ).fetchone()
+                self._commit()
+                return int(row[0]) if row else None
+
             row = self.conn.execute(
                 '''
                 SELECT id, phones_json, emails_json
@@ -229,16 +485,16 @@ class Database:
                     (
                         company,
                         contact_name,
-                        json.dumps(sorted(phones_set), ensure_ascii=False),
-                        json.dumps(sorted(emails_set), ensure_ascii=False),
+                        _json_dumps(sorted(phones_set)),
+                        _json_dumps(sorted(emails_set)),
                     ),
                 )
-                self.conn.commit()
+                self._commit()
                 return int(cursor.lastrowid) if cursor.lastrowid else None
 
             card_id = int(row["id"])
-            existing_phones = set(json.loads(row["phones_json"] or "[]"))
-            existing_emails = set(json.loads(row["emails_json"] or "[]"))
+            existing_phones = set(_json_loads(row["phones_json"] or "[]"))
+            existing_emails = set(_json_loads(row["emails_json"] or "[]"))
 
             merged_phones = sorted(existing_phones | phones_set)
             merged_emails = sorted(existing_emails | emails_set)
@@ -250,12 +506,12 @@ class Database:
                 WHERE id = ?
                 ''',
                 (
-                    json.dumps(merged_phones, ensure_ascii=False),
-                    json.dumps(merged_emails, ensure_ascii=False),
+                    _json_dumps(merged_phones),
+                    _json_dumps(merged_emails),
                     card_id,
                 ),
             )
-            self.conn.commit()
+            self._commit()
             return card_id
 
         except Exception as e:
@@ -278,7 +534,7 @@ class Database:
                 ''',
                 (business_card_id, announcement_id, role),
             )
-            self.conn.commit()
+            self._commit()
             return True
         except Exception as e:
             logger.error(f"写入名片关联失败: {e}")
@@ -293,60 +549,51 @@ class Database:
         try:
             self.connect()
 
+            # projects_count由触发器维护在名片表上，这里不再
+            # JOIN关联表 + GROUP BY。
+            # phones/emails由SQLite的json_each直接拼成逗号串，
+            # Python侧不再逐行json解析
             if like:
+                # instr直接做子串判断：不拼'%...%'模式串、不走LIKE的
+                # 通配符状态机（语义与'%x%'一致；公司名为中文，
+                # LIKE的ASCII大小写折叠在这里没有意义）
                 cursor = self.conn.execute(
                     '''
                     SELECT
-                        bc.id,
-                        bc.company,
-                        bc.contact_name,
-                        bc.phones_json,
-                        bc.emails_json,
-                        COUNT(DISTINCT bcm.announcement_id) AS projects_count,
-                        bc.updated_at
-                    FROM business_cards bc
-                    LEFT JOIN business_card_mentions bcm
-                        ON bcm.business_card_id = bc.id
-                    WHERE bc.company LIKE ?
-                    GROUP BY bc.id
-                    ORDER BY projects_count DESC, bc.updated_at DESC
+                        id, company, contact_name,
+                        phones_json, emails_json,
+                        COALESCE((SELECT group_concat(value, ', ')
+                                  FROM json_each(phones_json)), '') AS phones,
+                        COALESCE((SELECT group_concat(value, ', ')
+                                  FROM json_each(emails_json)), '') AS emails,
+                        projects_count, updated_at
+                    FROM business_cards
+                    WHERE instr(company, ?) > 0
+                    ORDER BY projects_count DESC, updated_at DESC
                     LIMIT ?
                     ''',
-                    (f"%{company}%", limit),
+                    (company, limit),
                 )
             else:
                 cursor = self.conn.execute(
                     '''
                     SELECT
-                        bc.id,
-                        bc.company,
-                        bc.contact_name,
-                        bc.phones_json,
-                        bc.emails_json,
-                        COUNT(DISTINCT bcm.announcement_id) AS projects_count,
-                        bc.updated_at
-                    FROM business_cards bc
-                    LEFT JOIN business_card_mentions bcm
-                        ON bcm.business_card_id = bc.id
-                    WHERE bc.company = ?
-                    GROUP BY bc.id
-                    ORDER BY projects_count DESC, bc.updated_at DESC
+                        id, company, contact_name,
+                        phones_json, emails_json,
+                        COALESCE((SELECT group_concat(value, ', ')
+                                  FROM json_each(phones_json)), '') AS phones,
+                        COALESCE((SELECT group_concat(value, ', ')
+                                  FROM json_each(emails_json)), '') AS emails,
+                        projects_count, updated_at
+                    FROM business_cards
+                    WHERE company = ?
+                    ORDER BY projects_count DESC, updated_at DESC
                     LIMIT ?
                     ''',
                     (company, limit),
                 )
 
-            rows = [dict(r) for r in cursor.fetchall()]
-            for r in rows:
-                try:
-                    r["phones"] = json.loads(r.get("phones_json") or "[]")
-                except Exception:
-                    r["phones"] = []
-                try:
-                    r["emails"] = json.loads(r.get("emails_json") or "[]")
-                except Exception:
-                    r["emails"] = []
-            return rows
+            return [dict(r) for r in cursor.fetchall()]
 
         except Exception as e:
             logger.error(f"查询名片失败: {e}")
@@ -383,8 +630,6 @@ class Database:
         Returns:
             插入的联系人数量
         """
-        count = 0
-
         try:
             self.connect()
 
@@ -398,38 +643,33 @@ class Database:
             if not companies[0]:
                 companies = ['']
 
-            # 生成组合并插入
-            for company in companies:
-                for name in contact_names:
-                    for phone in phones:
-                        for email in emails:
-                            # 至少要有一种联系方式
-                            if not phone and not email:
-                                continue
-
-                            try:
-                                self.conn.execute('''
-                                    INSERT INTO contacts
-                                    (announcement_id, company, contact_name, phone, email)
-                                    VALUES (?, ?, ?, ?, ?)
-                                ''', (
-                                    announcement_id,
-                                    company,
-                                    name,
-                                    phone,
-                                    email,
-                                ))
-                                count += 1
-                            except sqlite3.IntegrityError:
-                                pass  # 忽略重复
-
-            self.conn.commit()
+            # 先生成组合，再用executemany一次性写入：
+            # 单条execute每次都有语句准备和Python调用开销
+            rows = [
+                (announcement_id, company, name, phone, email)
+                for company in companies
+                for name in contact_names
+                for phone in phones
+                for email in emails
+                if phone or email  # 至少要有一种联系方式
+            ]
+            if not rows:
+                return 0
+
+            cursor = self.conn.executemany('''
+                INSERT OR IGNORE INTO contacts
+                (announcement_id, company, contact_name, phone, email)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            count = cursor.rowcount
+
+            self._commit()
             logger.info(f"插入 {count} 个联系人")
+            return count
 
         except Exception as e:
             logger.error(f"插入联系人失败: {e}")
-
-        return count
+            return 0
 
     def get_announcements(self, source: str = None, limit: int = 100) -> List[Dict]:
         """
@@ -526,13 +766,12 @@ class Database:
                 GROUP BY source
             ''').fetchall()
 
-            # 按公司统计
+            # 按公司统计：读触发器维护的汇总表，免去contacts全表GROUP BY
             by_company = self.conn.execute('''
-                SELECT company, COUNT(*) as count
-                FROM contacts
-                WHERE company IS NOT NULL AND company != ''
-                GROUP BY company
-                ORDER BY count DESC
+                SELECT company, cnt
+                FROM company_counts
+                WHERE cnt > 0
+                ORDER BY cnt DESC
                 LIMIT 20
             ''').fetchall()
 
@@ -2,18 +2,37 @@
 数据导出模块
 导出为Excel、CSV等格式
 """
+import csv
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
 
-import pandas as pd
-
 from config.settings import EXPORT_DIR, EXPORT_FORMATS
 
 logger = logging.getLogger(__name__)
 
 
+def _write_xlsx(file_path, sheet_name: str, columns: List[str], rows) -> None:
+    """用openpyxl只写模式逐行落盘，不经过DataFrame/普通单元格树"""
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    ws.append(columns)
+    for row in rows:
+        ws.append(row)
+    wb.save(file_path)
+
+
+def _write_csv(file_path, columns: List[str], records: List[Dict]) -> None:
+    """标准库csv直写；utf-8-sig让Excel正确识别中文"""
+    with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(records)
+
+
 class DataExporter:
     """数据导出器"""
 
@@ -42,22 +61,19 @@ class DataExporter:
             logger.warning("没有数据可导出")
             return ""
 
-        # 转换为DataFrame
-        df = pd.DataFrame(announcements)
-
-        # 选择需要的列
+        # 需要的列
         columns = ['title', 'url', 'publish_date', 'source', 'scraped_at']
-        df = df[[c for c in columns if c in df.columns]]
 
         # 生成文件名
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
         if format == 'excel':
             file_path = self.export_dir / f"announcements_{timestamp}.xlsx"
-            df.to_excel(file_path, index=False, engine='openpyxl')
+            _write_xlsx(file_path, 'announcements', columns,
+                        (tuple(a.get(c, '') for c in columns) for a in announcements))
         elif format == 'csv':
             file_path = self.export_dir / f"announcements_{timestamp}.csv"
-            df.to_csv(file_path, index=False, encoding='utf-8-sig')
+            _write_csv(file_path, columns, announcements)
         else:
             logger.error(f"不支持的导出格式: {format}")
             return ""
@@ -80,30 +96,29 @@ class DataExporter:
             logger.warning("没有联系人可导出")
             return ""
 
-        # 转换为DataFrame
-        df = pd.DataFrame(contacts)
-
-        # 选择需要的列
+        # 需要的列
         columns = ['company', 'contact_name', 'phone', 'email']
-        df = df[[c for c in columns if c in df.columns]]
 
-        # 去重
-        df = df.drop_duplicates()
+        # 去重（保持首次出现的顺序）
+        rows = list(dict.fromkeys(
+            tuple(c.get(col, '') for col in columns) for c in contacts
+        ))
 
         # 生成文件名
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
         if format == 'excel':
             file_path = self.export_dir / f"contacts_{timestamp}.xlsx"
-            df.to_excel(file_path, index=False, engine='openpyxl')
+            _write_xlsx(file_path, 'contacts', columns, rows)
         elif format == 'csv':
             file_path = self.export_dir / f"contacts_{timestamp}.csv"
-            df.to_csv(file_path, index=False, encoding='utf-8-sig')
+            _write_csv(file_path, columns,
+                       [dict(zip(columns, row)) for row in rows])
         else:
             logger.error(f"不支持的导出格式: {format}")
             return ""
 
-        logger.info(f"导出 {len(df)} 条联系人到: {file_path}")
+        logger.info(f"导出 {len(rows)} 条联系人到: {file_path}")
         return str(file_path)
 
     def export_summary(self, stats: Dict, format: str = 'excel') -> str:
@@ -136,18 +151,25 @@ class DataExporter:
         }
 
         if format == 'excel':
+            import openpyxl
+
             file_path = self.export_dir / f"summary_{timestamp}.xlsx"
 
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                for sheet_name, data in summary_data.items():
-                    df = pd.DataFrame(data)
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+            wb = openpyxl.Workbook(write_only=True)
+            for sheet_name, data in summary_data.items():
+                ws = wb.create_sheet(sheet_name)
+                if data:
+                    columns = list(data[0].keys())
+                    ws.append(columns)
+                    for record in data:
+                        ws.append(tuple(record.get(c, '') for c in columns))
+            wb.save(file_path)
 
         elif format == 'csv':
             # CSV只能导出一个工作表，导出总览
             file_path = self.export_dir / f"summary_{timestamp}.csv"
-            df = pd.DataFrame(summary_data['总览'])
-            df.to_csv(file_path, index=False, encoding='utf-8-sig')
+            overview = summary_data['总览']
+            _write_csv(file_path, list(overview[0].keys()), overview)
         else:
             logger.error(f"不支持的导出格式: {format}")
             return ""
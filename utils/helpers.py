@@ -9,7 +9,12 @@ from config.settings import LOG_LEVEL, LOG_FILE
 
 
 def setup_logging():
-    """设置日志"""
+    """设置日志（幂等：重复调用不会叠加处理器）"""
+    # 已配置过就直接返回：重复调用会再挂一组handler，
+    # 导致每条日志重复输出、日志文件被重复打开
+    if logging.getLogger().hasHandlers():
+        return
+
     # 确保日志目录存在
     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
@@ -2,14 +2,18 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Iterable, List, Optional
 
+# 支持中文/英文逗号分隔；模块级预编译，避免每次调用的
+# replace中间串与重复编译
+_SPLIT_RE = re.compile(r"[,，]")
+
 
 def _split_keywords(raw: str) -> List[str]:
-    # 支持中文/英文逗号分隔
     parts = []
-    for part in (raw or "").replace("，", ",").split(","):
+    for part in _SPLIT_RE.split(raw or ""):
         s = part.strip()
         if s:
             parts.append(s)
@@ -24,26 +28,29 @@ def load_keywords(keywords: Optional[Iterable[str]], kw_file: Optional[str]) ->
     - `kw_file`: 文本文件路径，每行一个关键词；支持注释行（# 开头）与逗号分隔
     - 返回值：去重（保序）
     """
-    result: List[str] = []
-    seen: set[str] = set()
+    tokens: List[str] = []
 
     for item in keywords or []:
-        for kw in _split_keywords(item):
-            if kw not in seen:
-                seen.add(kw)
-                result.append(kw)
+        tokens.extend(_split_keywords(item))
 
     if kw_file:
-        path = Path(kw_file)
-        if path.exists():
-            for line in path.read_text(encoding="utf-8").splitlines():
-                s = line.strip()
-                if not s or s.startswith("#"):
-                    continue
-                for kw in _split_keywords(s):
-                    if kw not in seen:
-                        seen.add(kw)
-                        result.append(kw)
-
-    return result
+        # 直接open并捕获OSError，省掉exists()的一次stat，
+        # 也避免exists与open之间文件被移走的竞态
+        try:
+            f = Path(kw_file).open("r", encoding="utf-8")
+        except OSError:
+            f = None
+        if f is not None:
+            # 逐行迭代而非read_text().splitlines()：峰值内存只有
+            # 当前行，不再是整个文件外加行列表
+            with f:
+                for line in f:
+                    s = line.strip()
+                    if not s or s.startswith("#"):
+                        continue
+                    tokens.extend(_split_keywords(s))
+
+    # dict.fromkeys去重：插入即去重且保序，全在C层完成，
+    # 替代逐项的set成员检查+双append
+    return list(dict.fromkeys(tokens))
 